@@ -12,6 +12,8 @@ def pytest_configure(config):
     """
     Хук, который выполняется перед запуском любых тестов
     """
+    if "torchvision.transforms.functional_tensor" in sys.modules:
+        return
     try:  # fixes incompatibility issue with outdated basicsr package
         import torchvision.transforms.functional_tensor  # noqa: F401
     except ImportError:
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 import asyncio
+import contextlib
 import os
-import time
 import sys
 
 os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'  # do not flood with oneDNN spam
@@ -10,15 +10,16 @@ if sys.version_info < (3, 10):
     print('Python version is not supported - please upgrade to 3.10 or higher.')
     quit()
 
-try:  # fixes incompatibility issue with outdated basicsr package
-    import torchvision.transforms.functional_tensor  # noqa: F401
-except ImportError:
-    try:
-        import torchvision.transforms.functional as functional
-
-        sys.modules["torchvision.transforms.functional_tensor"] = functional
+if "torchvision.transforms.functional_tensor" not in sys.modules:
+    try:  # fixes incompatibility issue with outdated basicsr package
+        import torchvision.transforms.functional_tensor  # noqa: F401
     except ImportError:
-        pass  # shrug...
+        try:
+            import torchvision.transforms.functional as functional
+
+            sys.modules["torchvision.transforms.functional_tensor"] = functional
+        except ImportError:
+            pass  # shrug...
 
 from sinner.AppLogger import setup_logging  # noqa: E402
 import signal  # noqa: E402
@@ -57,17 +58,25 @@ class Sin(Sinner):
         # Create and start server
         server = FrameProcessingServer(self.parameters)
 
-        # Start the server
-        asyncio.run(server.start_server())
-        # self.logger.info("Server started successfully")
+        async def serve() -> None:
+            # Keep the server running until it is stopped by a signal
+            stop_event = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            for signal_number in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.add_signal_handler(signal_number, stop_event.set)
+                except NotImplementedError:  # event loops on Windows do not support signal handlers
+                    signal.signal(signal_number, lambda signal_number_, frame: loop.call_soon_threadsafe(stop_event.set))
+            server_task = asyncio.create_task(server.start_server())
+            stop_task = asyncio.create_task(stop_event.wait())
+            await asyncio.wait({server_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+            for task in (server_task, stop_task):
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
 
-        # Keep the script running
         try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            # self.logger.info("Interrupted by user")
-            pass
+            asyncio.run(serve())
         finally:
             server.stop_server()
             # self.logger.info("Server shut down")
@@ -1,6 +1,9 @@
+import atexit
 import logging
-from logging.handlers import SysLogHandler, RotatingFileHandler, TimedRotatingFileHandler
-from typing import Optional, Dict, List, Union, Any
+import queue
+import threading
+from logging.handlers import SysLogHandler, RotatingFileHandler, TimedRotatingFileHandler, QueueHandler, QueueListener, MemoryHandler
+from typing import Optional, Dict, List, Union, Any, Callable
 
 from colorama import Fore, Back, Style
 
@@ -18,51 +21,91 @@ class LevelBasedFormatter(logging.Formatter):
         # Форматы для конкретных уровней
         self.formats = formats
         super().__init__(self.default_fmt)
+        # Готовые форматтеры для каждого уровня, чтобы не перестраивать формат на каждую запись
+        self._formatters: Dict[int, logging.Formatter] = {level: logging.Formatter(fmt) for level, fmt in formats.items() if level is not None}
+        self._default_formatter = logging.Formatter(self.default_fmt)
 
     def format(self, record: logging.LogRecord) -> str:
-        # Сохраняем оригинальный формат
-        # noinspection PyProtectedMember
-        original_fmt = self._style._fmt
+        # Выбираем форматтер в зависимости от уровня
+        return self._formatters.get(record.levelno, self._default_formatter).format(record)
 
-        # Выбираем формат в зависимости от уровня
-        if record.levelno in self.formats:
-            self._style._fmt = self.formats[record.levelno]
-        else:
-            self._style._fmt = self.default_fmt
-
-        # Форматируем запись
-        result = super().format(record)
 
-        # Восстанавливаем оригинальный формат
-        self._style._fmt = original_fmt
-
-        return result
+# Цветовые префиксы для каждого уровня логирования
+COLOR_PREFIXES: Dict[int, str] = {
+    logging.DEBUG: Fore.CYAN + Back.BLACK,
+    logging.INFO: Fore.LIGHTWHITE_EX + Back.BLACK,
+    logging.WARNING: Fore.YELLOW + Back.BLACK,
+    logging.ERROR: Fore.BLACK + Back.RED,
+    logging.CRITICAL: Fore.WHITE + Back.RED
+}
+COLOR_RESET: str = Style.RESET_ALL
 
 
 class ColoredFormatter(LevelBasedFormatter):
     """Форматтер для цветного вывода в консоль с разными форматами для разных уровней"""
 
     def format(self, record: logging.LogRecord) -> str:
-        # Форматируем сообщение с учетом разных форматов по уровням
-        log_message = super().format(record)
+        # Форматируем сообщение с учетом разных форматов по уровням и применяем цвет
+        return f"{COLOR_PREFIXES.get(record.levelno, '')}{super().format(record)}{COLOR_RESET}"
 
-        # Подбираем цвет в зависимости от уровня
-        colors = {
-            logging.DEBUG: Fore.CYAN + Back.BLACK,
-            logging.INFO: Fore.LIGHTWHITE_EX + Back.BLACK,
-            logging.WARNING: Fore.YELLOW + Back.BLACK,
-            logging.ERROR: Fore.BLACK + Back.RED,
-            logging.CRITICAL: Fore.WHITE + Back.RED
-        }
 
-        # Применяем цвет к сообщению
-        color = colors.get(record.levelno, '')
-        return f"{color}{log_message}{Style.RESET_ALL}"
+class BufferedHandler(MemoryHandler):
+    """Буферизующий обработчик, который закрывает целевой обработчик вместе с собой"""
+
+    def close(self) -> None:
+        target = self.target
+        super().close()
+        if target is not None:
+            target.close()
+
+
+class BufferedStreamHandler(logging.StreamHandler):  # type: ignore[type-arg]
+    """Потоковый обработчик, который копит записи и выводит их одной операцией записи не чаще раза в flush_interval секунд"""
+
+    def __init__(self, stream: Optional[Any] = None, flush_interval: float = 0.1):
+        """
+        :param stream: Поток вывода (по умолчанию sys.stderr)
+        :param flush_interval: Интервал сброса накопленных записей в секундах
+        """
+        super().__init__(stream)
+        self.flush_interval = flush_interval
+        self._buffer: List[str] = []
+        self._flush_timer: Optional[threading.Timer] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._buffer.append(self.format(record) + self.terminator)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._buffer and self.stream:
+                self.stream.write(''.join(self._buffer))
+                self._buffer.clear()
+            super().flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        self.flush()
+        super().close()
 
 
 # Создаем глобальный логгер приложения
 app_logger = logging.getLogger("sinner")
 
+# Фоновый слушатель очереди, в потоке которого работают настроенные обработчики
+app_listener: Optional[QueueListener] = None
+
 # Определяем форматы для разных уровней (глобально)
 DEFAULT_FORMATS = {
     # Подробный формат для отладки, ошибок и критических ошибок
@@ -76,69 +119,117 @@ DEFAULT_FORMATS = {
     None: '%(module)s: %(message)s'
 }
 
+
+def _create_stdout_handler(**kwargs: Any) -> logging.Handler:
+    # Получение кастомных форматов или использование стандартных
+    formats = kwargs.pop('formats', DEFAULT_FORMATS)
+    flush_interval = kwargs.pop('flushInterval', 0.1)
+
+    handler = BufferedStreamHandler(flush_interval=flush_interval)
+    handler.setFormatter(ColoredFormatter(formats))
+    return handler
+
+
+def _create_file_handler(**kwargs: Any) -> logging.Handler:
+    filename = kwargs.pop('filename', 'sinner.log')
+    formats = kwargs.pop('formats', DEFAULT_FORMATS)
+    mode = kwargs.pop('mode', 'a')  # По умолчанию используем append режим
+    encoding = kwargs.pop('encoding', None)
+
+    handler = logging.FileHandler(filename, mode=mode, encoding=encoding)
+    handler.setFormatter(LevelBasedFormatter(formats))
+    return handler
+
+
+def _create_syslog_handler(**kwargs: Any) -> logging.Handler:
+    address = kwargs.pop('address', '/dev/log')
+    facility = kwargs.pop('facility', SysLogHandler.LOG_USER)
+    socktype = kwargs.pop('socktype', None)
+    formats = kwargs.pop('formats', DEFAULT_FORMATS)
+
+    handler = SysLogHandler(address=address, facility=facility, socktype=socktype)
+    handler.setFormatter(LevelBasedFormatter(formats))
+    return handler
+
+
+def _create_rotating_file_handler(**kwargs: Any) -> logging.Handler:
+    filename = kwargs.pop('filename', 'sinner.rotate.log')
+    max_bytes = kwargs.pop('maxBytes', 10 * 1024 * 1024)  # 10MB по умолчанию
+    backup_count = kwargs.pop('backupCount', 5)  # 5 файлов по умолчанию
+    formats = kwargs.pop('formats', DEFAULT_FORMATS)
+
+    handler = RotatingFileHandler(filename, maxBytes=max_bytes, backupCount=backup_count)
+    handler.setFormatter(LevelBasedFormatter(formats))
+    return handler
+
+
+def _create_timed_rotating_file_handler(**kwargs: Any) -> logging.Handler:
+    filename = kwargs.pop('filename', 'sinner.rotate.log')
+    when = kwargs.pop('when', 'D')  # По умолчанию ежедневно
+    interval = kwargs.pop('interval', 1)
+    backup_count = kwargs.pop('backupCount', 7)  # 7 файлов по умолчанию
+    formats = kwargs.pop('formats', DEFAULT_FORMATS)
+
+    handler = TimedRotatingFileHandler(filename, when=when, interval=interval, backupCount=backup_count)
+    handler.setFormatter(LevelBasedFormatter(formats))
+    return handler
+
+
+# Фабрики обработчиков по их типам
+HANDLER_FACTORIES: Dict[str, Callable[..., logging.Handler]] = {
+    'stdout': _create_stdout_handler,
+    'file': _create_file_handler,
+    'syslog': _create_syslog_handler,
+    'rotating_file': _create_rotating_file_handler,
+    'timed_rotating_file': _create_timed_rotating_file_handler,
+}
+
 # Типы обработчиков
-HandlerType: List[str] = ['stdout', 'file', 'syslog', 'rotating_file', 'timed_rotating_file']
+HandlerType: List[str] = list(HANDLER_FACTORIES)
+# Типы обработчиков, записи которых копятся в буфере и сбрасываются пачкой
+BufferedHandlerType: List[str] = ['file', 'syslog', 'rotating_file', 'timed_rotating_file']
+# Размер буфера записей по умолчанию
+BUFFER_CAPACITY: int = 1024
 
 
-def add_handler(handler_type: str, level: int = logging.NOTSET, **kwargs) -> logging.Handler:  # type: ignore[no-untyped-def]
+def create_handler(handler_type: str, level: int = logging.NOTSET, **kwargs) -> logging.Handler:  # type: ignore[no-untyped-def]
     """
-    Добавляет обработчик указанного типа к глобальному логгеру
-    
-    :param handler_type: Тип обработчика ('stdout', 'file', 'syslog', 'rotating_file', 'timed_rotating_file')
+    Создает обработчик указанного типа, не подключая его к логгеру
+
+    :param handler_type: Тип обработчика (один из HANDLER_FACTORIES)
     :param level: Уровень логирования для обработчика
-    :param kwargs: Дополнительные параметры для обработчика
+    :param kwargs: Дополнительные параметры для обработчика.
+                   capacity и flushLevel задают буферизацию для файловых обработчиков и syslog (capacity=0 отключает буфер)
     :return: Созданный обработчик
     """
+    capacity = kwargs.pop('capacity', BUFFER_CAPACITY)
+    flush_level = kwargs.pop('flushLevel', logging.ERROR)
 
-    if handler_type == 'stdout':
-        # Получение кастомных форматов или использование стандартных
-        formats = kwargs.pop('formats', DEFAULT_FORMATS)
-        handler: logging.Handler = logging.StreamHandler()
-        handler.setFormatter(ColoredFormatter(formats))
-
-    elif handler_type == 'file':
-        filename = kwargs.pop('filename', 'sinner.log')
-        formats = kwargs.pop('formats', DEFAULT_FORMATS)
-        mode = kwargs.pop('mode', 'a')  # По умолчанию используем append режим
-        encoding = kwargs.pop('encoding', None)
-
-        handler = logging.FileHandler(filename, mode=mode, encoding=encoding)
-        handler.setFormatter(LevelBasedFormatter(formats))
-
-    elif handler_type == 'syslog':
-        address = kwargs.pop('address', '/dev/log')
-        facility = kwargs.pop('facility', SysLogHandler.LOG_USER)
-        socktype = kwargs.pop('socktype', None)
-        formats = kwargs.pop('formats', DEFAULT_FORMATS)
-
-        handler = SysLogHandler(address=address, facility=facility, socktype=socktype)
-        handler.setFormatter(LevelBasedFormatter(formats))
-
-    elif handler_type == 'rotating_file':
-        filename = kwargs.pop('filename', 'sinner.rotate.log')
-        max_bytes = kwargs.pop('maxBytes', 10 * 1024 * 1024)  # 10MB по умолчанию
-        backup_count = kwargs.pop('backupCount', 5)  # 5 файлов по умолчанию
-        formats = kwargs.pop('formats', DEFAULT_FORMATS)
-
-        handler = RotatingFileHandler(filename, maxBytes=max_bytes, backupCount=backup_count)
-        handler.setFormatter(LevelBasedFormatter(formats))
-
-    elif handler_type == 'timed_rotating_file':
-        filename = kwargs.pop('filename', 'sinner.rotate.log')
-        when = kwargs.pop('when', 'D')  # По умолчанию ежедневно
-        interval = kwargs.pop('interval', 1)
-        backup_count = kwargs.pop('backupCount', 7)  # 7 файлов по умолчанию
-        formats = kwargs.pop('formats', DEFAULT_FORMATS)
-
-        handler = TimedRotatingFileHandler(filename, when=when, interval=interval, backupCount=backup_count)
-        handler.setFormatter(LevelBasedFormatter(formats))
-
-    else:
+    factory = HANDLER_FACTORIES.get(handler_type)
+    if factory is None:
         raise ValueError(f"Неизвестный тип обработчика: {handler_type}")
+    handler = factory(**kwargs)
+
+    if handler_type in BufferedHandlerType and capacity > 0:
+        # Записи сбрасываются в целевой обработчик при заполнении буфера, на важных уровнях или при закрытии
+        handler = BufferedHandler(capacity, flushLevel=flush_level, target=handler, flushOnClose=True)
 
     if level != logging.NOTSET:
         handler.setLevel(level)
 
+    return handler
+
+
+def add_handler(handler_type: str, level: int = logging.NOTSET, **kwargs) -> logging.Handler:  # type: ignore[no-untyped-def]
+    """
+    Добавляет обработчик указанного типа к глобальному логгеру
+
+    :param handler_type: Тип обработчика ('stdout', 'file', 'syslog', 'rotating_file', 'timed_rotating_file')
+    :param level: Уровень логирования для обработчика
+    :param kwargs: Дополнительные параметры для обработчика
+    :return: Созданный обработчик
+    """
+    handler = create_handler(handler_type, level, **kwargs)
     app_logger.addHandler(handler)
     return handler
 
@@ -163,7 +254,9 @@ def setup_logging(level: int = logging.DEBUG, handlers: Optional[Union[List[str]
                     или словарем с ключами 'type', 'level' и другими параметрами.
                     Пример: ['console', {'type': 'file', 'filename': 'app.log', 'level': logging.INFO}]
     """
+    global app_listener
     # Очистка предыдущих обработчиков
+    stop_logging()
     for handler in app_logger.handlers[:]:
         app_logger.removeHandler(handler)
 
@@ -174,13 +267,35 @@ def setup_logging(level: int = logging.DEBUG, handlers: Optional[Union[List[str]
     if handlers is None:
         handlers = ['stdout']
 
-    # Добавляем все указанные обработчики
+    # Создаем все указанные обработчики
+    targets: List[logging.Handler] = []
     for handler_spec in handlers:
         if isinstance(handler_spec, str):
-            add_handler(handler_spec)
+            targets.append(create_handler(handler_spec))
         elif isinstance(handler_spec, dict):
             handler_type = handler_spec.pop('type')
             handler_level = handler_spec.pop('level', logging.NOTSET)
-            add_handler(handler_type, handler_level, **handler_spec)
+            targets.append(create_handler(handler_type, handler_level, **handler_spec))
         else:
             raise ValueError(f"Неверный формат спецификации обработчика: {handler_spec}")
+
+    # Вызывающие потоки только кладут записи в очередь, ввод-вывод выполняется в потоке слушателя
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    app_listener = QueueListener(log_queue, *targets, respect_handler_level=True)
+    app_logger.addHandler(QueueHandler(log_queue))
+    app_listener.start()
+
+
+def stop_logging() -> None:
+    """
+    Останавливает слушатель очереди, дописывая все накопленные записи, и закрывает его обработчики
+    """
+    global app_listener
+    if app_listener is not None:
+        app_listener.stop()
+        for handler in app_listener.handlers:
+            handler.close()
+        app_listener = None
+
+
+atexit.register(stop_logging)
@@ -1,44 +1,71 @@
 import contextlib
-import io
+import os
 import threading
-from typing import List
+from operator import attrgetter
+from typing import List, ClassVar, Dict, Tuple
+
+import numpy as np
 from insightface.app import FaceAnalysis
 from insightface.app.common import Face
 
 from sinner.typing import Frame
 
+# most frames contain only a few faces, and the builtin min() is faster than building an array for them
+_FEW_FACES: int = 8
+_get_bbox = attrgetter('bbox')
+
+
+def _face_left(face: Face) -> float:
+    return _get_bbox(face)[0]
+
 
 class FaceAnalyser:
     _face_analyser: FaceAnalysis | None = None
     _execution_providers: List[str]
     _less_output: bool = True
 
+    # initialized models, shared between all analysers with the same execution providers
+    _shared_analysers: ClassVar[Dict[Tuple[str, ...], FaceAnalysis]] = {}
+    _init_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, execution_providers: List[str], less_output: bool = True):
         self._execution_providers = execution_providers
         self._less_output = less_output
 
     @property
     def face_analyser(self) -> FaceAnalysis:
-        if self._face_analyser is None:
-            with threading.Lock():
-                if self._less_output:
-                    with contextlib.redirect_stdout(io.StringIO()):
-                        self._face_analyser = FaceAnalysis(name='buffalo_l', providers=self._execution_providers)
-                        self._face_analyser.prepare(ctx_id=0, det_size=(640, 640))
-                else:
-                    self._face_analyser = FaceAnalysis(name='buffalo_l', providers=self._execution_providers)
-                    self._face_analyser.prepare(ctx_id=0, det_size=(640, 640))
-        return self._face_analyser
+        face_analyser = self._face_analyser
+        if face_analyser is not None:  # per-frame path: no locking at all
+            return face_analyser
+        key = tuple(self._execution_providers)
+        face_analyser = FaceAnalyser._shared_analysers.get(key)
+        if face_analyser is None:
+            with FaceAnalyser._init_lock:
+                face_analyser = FaceAnalyser._shared_analysers.get(key)
+                if face_analyser is None:
+                    face_analyser = self._create_face_analyser()
+                    FaceAnalyser._shared_analysers[key] = face_analyser
+        self._face_analyser = face_analyser
+        return face_analyser
+
+    def _create_face_analyser(self) -> FaceAnalysis:
+        with contextlib.ExitStack() as stack:
+            if self._less_output:  # insightface banner goes straight to the null device
+                stack.enter_context(contextlib.redirect_stdout(stack.enter_context(open(os.devnull, 'w'))))
+            face_analyser = FaceAnalysis(name='buffalo_l', providers=self._execution_providers)
+            face_analyser.prepare(ctx_id=0, det_size=(640, 640))
+        return face_analyser
 
     def get_one_face(self, frame: Frame) -> None | Face:
-        face = self.face_analyser.get(frame)
-        try:
-            return min(face, key=lambda x: x.bbox[0])
-        except ValueError:
+        faces = self.face_analyser.get(frame)
+        if not faces:
             return None
+        # the leftmost face
+        if len(faces) <= _FEW_FACES:
+            return min(faces, key=_face_left)
+        lefts = np.fromiter((face.bbox[0] for face in faces), dtype=np.float32, count=len(faces))
+        return faces[int(lefts.argmin())]
 
     def get_many_faces(self, frame: Frame) -> None | List[Face]:
-        try:
-            return self.face_analyser.get(frame)
-        except IndexError:
-            return None
+        faces = self.face_analyser.get(frame)
+        return faces if faces else None
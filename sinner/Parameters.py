@@ -1,59 +1,82 @@
 import shlex
 import sys
 from argparse import ArgumentParser, Namespace
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 from sinner.models.Config import Config
-from sinner.validators.AttributeDocumenter import AttributeDocumenter
 
 
 class Parameters:
     parser: ArgumentParser = ArgumentParser()
     parameters: Namespace
+    _config: Config
 
     def __init__(self, source: Namespace | str | None = None):
         self.parameters: Namespace = source if isinstance(source, Namespace) else self.command_line_to_namespace(source)
         if 'h' in self.parameters or 'help' in self.parameters:
+            # the documenter imports every documented module, so it is loaded only when the help is requested
+            from sinner.validators.AttributeDocumenter import AttributeDocumenter
             AttributeDocumenter().show_help()
         # add values from the ini file
-        file_configuration_dict = vars(Config(self.parameters).read_section('sinner') or Namespace())
+        self._config = Config(self.parameters)
+        file_configuration_dict = vars(self._config.read_section('sinner') or Namespace())
         for key, value in file_configuration_dict.items():
             if key not in self.parameters:
                 self.parameters.__setattr__(key, value)
 
     def module_parameters(self, module_name: str) -> Namespace | None:
-        return Config(self.parameters).read_section(module_name)
+        return self._config.read_section(module_name)
 
     @staticmethod
     def command_line_to_namespace(cmd_params: str | None = None) -> Namespace:
         processed_parameters: Namespace = Namespace()
         if cmd_params is None:
-            args_list = sys.argv[1:]
+            args_list: List[str] | Tuple[str, ...] = sys.argv[1:]
         else:
-            args_list = shlex.split(cmd_params)
-        result = []
-        current_sublist: List[str] = []
+            args_list = Parameters.split_command_line(cmd_params)
+        key: str | None = None
+        values: List[str] = []
         for item in args_list:
             if item.startswith('--'):
-                if current_sublist:
-                    result.append(current_sublist)
-                    current_sublist = []
-                current_sublist.append(item)
+                if key is not None:
+                    Parameters._set_parameter(processed_parameters, key, values)
+                key, values = item, []
+            elif key is None:
+                key = item
             else:
-                current_sublist.append(item)
-        if current_sublist:
-            result.append(current_sublist)
-
-        for parameter in result:
-            if len(parameter) > 2:
-                setattr(processed_parameters, parameter[0].lstrip('-').replace('-', '_'), parameter[1:])
-            elif len(parameter) == 1 and '=' not in parameter[0]:
-                setattr(processed_parameters, parameter[0].lstrip('-').replace('-', '_'), True)
-            else:  # 2 args
-                key, value = parameter[0].split('=') if '=' in parameter[0] else parameter
-                setattr(processed_parameters, key.lstrip('-').replace('-', '_'), value)
+                values.append(item)
+        if key is not None:
+            Parameters._set_parameter(processed_parameters, key, values)
         return processed_parameters
 
+    @staticmethod
+    def _set_parameter(parameters: Namespace, key: str, values: List[str]) -> None:
+        """
+        Stores a single command-line parameter into the namespace
+        :param parameters: the target namespace
+        :param key: the parameter item, like '--key' or '--key=value'
+        :param values: values following the parameter item
+        """
+        name, separator, value = key.lstrip('-').partition('=')
+        name = sys.intern(name.replace('-', '_'))
+        if len(values) > 1:  # --key value1 value2
+            setattr(parameters, name, values)
+        elif separator:  # --key=value
+            setattr(parameters, name, value)
+        elif values:  # --key value
+            setattr(parameters, name, values[0])
+        else:  # --key
+            setattr(parameters, name, True)
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def split_command_line(cmd_params: str) -> Tuple[str, ...]:
+        # without quotes and escapes shlex splits by whitespace only, so the much faster str.split() gives the same result
+        if '"' not in cmd_params and "'" not in cmd_params and '\\' not in cmd_params:
+            return tuple(cmd_params.split())
+        return tuple(shlex.split(cmd_params))
+
     @staticmethod
     def parse_argument(argument: str) -> tuple[str, str] | tuple[str, list[str]] | None:  # key and list of values
         if not argument.startswith('--'):
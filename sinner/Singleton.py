@@ -1,14 +1,21 @@
+import threading
 from abc import ABCMeta
 from typing import Any
 
 
 class Singleton(type):
     _instances: dict[type, Any] = {}
+    _lock: threading.RLock = threading.RLock()  # reentrant, so a singleton may create another singleton in its __init__
 
     def __call__(cls, *args: Any, **kwargs: Any) -> Any:
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        instance = cls._instances.get(cls)
+        if instance is None:
+            with cls._lock:
+                instance = cls._instances.get(cls)
+                if instance is None:
+                    instance = super().__call__(*args, **kwargs)
+                    cls._instances[cls] = instance
+        return instance
 
 
 class SingletonABCMeta(ABCMeta, Singleton):
@@ -1,27 +1,31 @@
+import os
+import sys
 import tempfile
 from argparse import Namespace
-from tkinter import filedialog, LEFT, Button, Frame, BOTH, StringVar, NW, X, Event, TOP, CENTER, Menu, CASCADE, COMMAND, RADIOBUTTON, CHECKBUTTON, SEPARATOR, BooleanVar, RIDGE, BOTTOM, NE
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from functools import partial
+from tkinter import LEFT, Button, Frame, BOTH, StringVar, NW, X, Event, TOP, CENTER, Menu, CASCADE, COMMAND, RADIOBUTTON, CHECKBUTTON, SEPARATOR, BooleanVar, RIDGE, BOTTOM, NE
 from tkinter.ttk import Spinbox, Label, Notebook
-from typing import List, Union
+from typing import List, Union, Callable, Dict
 
 from customtkinter import CTk, CTkSlider
-from psutil import WINDOWS
 
+from sinner.AppLogger import app_logger
 from sinner.gui.controls.FramePlayer.BaseFramePlayer import ROTATE_90_CLOCKWISE, ROTATE_180, ROTATE_90_COUNTERCLOCKWISE
 from sinner.gui.controls.FramePosition.FrameSlider import FrameSlider
 from sinner.gui.controls.ThumbnailWidget.SourcesThumbnailWidget import SourcesThumbnailWidget
 from sinner.gui.controls.ThumbnailWidget.TargetsThumbnailWidget import TargetsThumbnailWidget
 from sinner.models.Event import Event as SinnerEvent
-from sinner.models.processing.LocalProcessingModel import LocalProcessingModel
 from sinner.gui.controls.FramePosition.BaseFramePosition import BaseFramePosition
 from sinner.gui.controls.FramePosition.SliderFramePosition import SliderFramePosition
 from sinner.gui.controls.StatusBar import StatusBar
+from sinner.gui.controls.ThumbnailWidget.BaseThumbnailWidget import BaseThumbnailWidget
 from sinner.gui.controls.TextBox import TextBox
 from sinner.models.Config import Config
 from sinner.models.audio.BaseAudioBackend import BaseAudioBackend
 from sinner.models.processing.ProcessingModelInterface import ProcessingModelInterface
-from sinner.models.processing.RemoteProcessingModel import RemoteProcessingModel
-from sinner.utilities import is_int, get_app_dir, get_type_extensions, is_image, is_dir, get_directory_file_list, halt, is_video
+from sinner.utilities import is_int, get_app_dir, get_type_extensions, is_dir, get_directory_file_list, halt, has_image_mimetype, has_video_mimetype
 from sinner.validators.AttributeLoader import Rules, AttributeLoader
 
 MODE_STANDALONE = "standalone"
@@ -51,6 +55,20 @@ class GUIForm(AttributeLoader):
     processing_mode: str  # standalone/remote
 
     _event_player_window_closed: SinnerEvent  # the event when the player window is closed (forwarded via GUIModel)
+    _config: Config  # settings storage, used to save the window geometry
+    _save_geometry_after_id: str | None = None  # the scheduled geometry saving call
+    _requested_width: int  # the window width, parsed from the geometry setting
+    _requested_position: str  # the window position, parsed from the geometry setting
+    _quality_min: int  # the quality spinbox lower bound
+    _quality_max: int  # the quality spinbox upper bound
+    _navigation_step: int = 1  # the arrow keys rewind step, 1% of the target frames count
+    _last_geometry: str | None = None  # the last saved window geometry
+    _last_state: str | None = None  # the last saved window state
+    _last_render_info: tuple[int, tuple[int, int]] | None = None  # the last shown quality and render resolution
+    _quality_after_id: str | None = None  # the scheduled quality applying call
+    _rewind_after_id: str | None = None  # the scheduled slider rewind call
+    _io_pool: ThreadPoolExecutor  # the pool for the libraries directories scanning
+    _library_generations: Dict[BaseThumbnailWidget, int]  # bumped on every library clearing, so stale directories scans are dropped
 
     def rules(self) -> Rules:
         return [
@@ -124,16 +142,21 @@ class GUIForm(AttributeLoader):
         ]
 
     def __init__(self, parameters: Namespace):
-        if WINDOWS:
+        if sys.platform == 'win32':
             import ctypes
             ctypes.windll.shcore.SetProcessDpiAwareness(1)  # type: ignore[attr-defined]  # it is a library method fixes the issue with different DPIs. Check ignored for non-windows PC like GitHub CI
         self.parameters = parameters
         super().__init__(parameters)
+        self._config = Config(self.parameters)
+        self._io_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        self._library_generations = {}
 
         #  Main window
         self.GUIWindow: CTk = CTk()  # the main window
         if self.geometry:
             self.GUIWindow.geometry(self.geometry)
+            size_part, self._requested_position = self.geometry.split('+', 1)
+            self._requested_width = int(size_part.split('x')[0])
         # if self.state:
         #     self.GUIWindow.wm_state(self.state)
         self.GUIWindow.iconbitmap(default=get_app_dir("sinner/gui/icons/sinner.ico"))  # the taskbar icon may not be changed due tkinter limitations
@@ -144,27 +167,24 @@ class GUIForm(AttributeLoader):
         self._event_player_window_closed = SinnerEvent(on_set_callback=lambda: _window_close_handler())
 
         def _window_close_handler() -> None:
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
             self.ProcessingModel.player_stop(wait=True)
             halt()
 
         self.NavigationFrame: Frame = Frame(self.GUIWindow)  # it is a frame for navigation control and progressbar
         self.StatusBar = StatusBar(self.GUIWindow, borderwidth=1, relief=RIDGE, items={"Target resolution": "", "Render size": ""})
 
-        if self.processing_mode == MODE_STANDALONE:
-            self.ProcessingModel = LocalProcessingModel(parameters, status_callback=lambda name, value: self.StatusBar.item(name, value), on_close_event=self._event_player_window_closed)
-        elif self.processing_mode == MODE_DISTRIBUTED:
-            self.ProcessingModel = RemoteProcessingModel(self.parameters, status_callback=lambda name, value: self.StatusBar.item(name, value), on_close_event=self._event_player_window_closed)
-        else:
-            raise Exception(f"Unknown mode: {self.processing_mode}")
+        self.ProcessingModel = self._create_processing_model()
 
         self.GUIWindow.bind("<Configure>", lambda event: _window_configure_handler(event))
         self.GUIWindow.bind("<FocusIn>", lambda event: _window_on_focus_handler(event))
 
         # noinspection PyUnusedLocal
         def _window_configure_handler(event: Event) -> None:  # type: ignore[type-arg]
-            if self.GUIWindow.wm_state() != 'zoomed':
-                Config(self.parameters).set_key(self.__class__.__name__, 'controls-geometry', self.GUIWindow.geometry())
-            Config(self.parameters).set_key(self.__class__.__name__, 'controls-state', self.GUIWindow.wm_state())
+            # <Configure> fires continuously while the window is dragged or resized, so the geometry is saved once it settles
+            if self._save_geometry_after_id is not None:
+                self.GUIWindow.after_cancel(self._save_geometry_after_id)
+            self._save_geometry_after_id = self.GUIWindow.after(200, self.save_geometry)
 
         # noinspection PyUnusedLocal
         def _window_on_focus_handler(event: Event) -> None:  # type: ignore[type-arg]
@@ -177,16 +197,16 @@ class GUIForm(AttributeLoader):
         def _window_key_release_handler(event: Event) -> None:  # type: ignore[type-arg]
             """Define hotkeys here"""
             if event.keycode == 37:  # left arrow
-                self.NavigateSlider.position = max(1, self.NavigateSlider.position - self.NavigateSlider.to // 100)
+                self.NavigateSlider.position = max(1, self.NavigateSlider.position - self._navigation_step)
                 self.ProcessingModel.rewind(self.NavigateSlider.position)
             if event.keycode == 39:  # right arrow
+                self.NavigateSlider.position = min(self.NavigateSlider.to, self.NavigateSlider.position + self._navigation_step)
                 self.ProcessingModel.rewind(self.NavigateSlider.position)
-                self.NavigateSlider.position = min(self.NavigateSlider.to, self.NavigateSlider.position + self.NavigateSlider.to // 100)
             if event.keycode == 32:  # space bar
                 _run_button_command()
 
         # Navigation slider
-        self.NavigateSlider: Union[CTkSlider, BaseFramePosition] = FrameSlider(self.NavigationFrame, from_=0, variable=self.ProcessingModel.position, command=lambda position: self.ProcessingModel.rewind(int(position)), progress=self.show_progress)
+        self.NavigateSlider: Union[CTkSlider, BaseFramePosition] = FrameSlider(self.NavigationFrame, from_=0, variable=self.ProcessingModel.position, command=lambda position: self.on_navigate_slider_change(int(position)), progress=self.show_progress)
 
         # Controls frame and contents
         self.BaseFrame: Frame = Frame(self.GUIWindow)  # it is a frame that holds all static controls with fixed size, such as main buttons and selectors
@@ -208,7 +228,8 @@ class GUIForm(AttributeLoader):
 
         self.QualityScaleLabel: Label = Label(self.SubControlsFrame, text="Quality scale:")
 
-        self.QualityScaleSpinbox: Spinbox = Spinbox(self.SubControlsFrame, from_=1, to=100, increment=1, command=lambda: self.on_quality_scale_change(int(self.QualityScaleSpinbox.get())))
+        self._quality_min, self._quality_max = 1, 100  # the bounds are static, so there's no need to query Tk every time
+        self.QualityScaleSpinbox: Spinbox = Spinbox(self.SubControlsFrame, from_=self._quality_min, to=self._quality_max, increment=1, command=lambda: self.on_quality_scale_change(int(self.QualityScaleSpinbox.get())))
         self.QualityScaleSpinbox.bind('<KeyRelease>', lambda event: self.on_quality_scale_change(int(self.QualityScaleSpinbox.get())))
         self.QualityScaleSpinbox.set(self.ProcessingModel.quality)
 
@@ -222,13 +243,11 @@ class GUIForm(AttributeLoader):
         # Source/target selection controls
         self.SourcePathFrame: Frame = Frame(self.ControlsFrame, borderwidth=2)
         self.SourcePathEntry: TextBox = TextBox(self.SourcePathFrame, state='readonly')
-        self.SelectSourceDialog = filedialog
-        self.ChangeSourceButton: Button = Button(self.SourcePathFrame, text="Browse for source", width=20, command=lambda: self.change_source())
+        self.ChangeSourceButton: Button = Button(self.SourcePathFrame, text="Browse for source", width=20, command=self.change_source)
 
         self.TargetPathFrame: Frame = Frame(self.ControlsFrame, borderwidth=2)
         self.TargetPathEntry: TextBox = TextBox(self.TargetPathFrame, state='readonly')
-        self.SelectTargetDialog = filedialog
-        self.ChangeTargetButton: Button = Button(self.TargetPathFrame, text="Browse for target", width=20, command=lambda: self.change_target())
+        self.ChangeTargetButton: Button = Button(self.TargetPathFrame, text="Browse for target", width=20, command=self.change_target)
 
         # Library widgets
         self.LibraryNotebook: Notebook = Notebook(self.WidgetsFrame)
@@ -237,8 +256,9 @@ class GUIForm(AttributeLoader):
 
         self.TargetsLibraryFrame = Frame(self.LibraryNotebook, borderwidth=2)
         self.LibraryNotebook.add(self.TargetsLibraryFrame, text='Targets')
-        self.SourcesLibrary = SourcesThumbnailWidget(self.SourcesLibraryFrame, temp_dir=vars(self.parameters).get('temp_dir', tempfile.gettempdir()), click_callback=self._set_source)
-        self.TargetsLibrary = TargetsThumbnailWidget(self.TargetsLibraryFrame, temp_dir=vars(self.parameters).get('temp_dir', tempfile.gettempdir()), click_callback=self._set_target)
+        thumbnails_temp_dir = getattr(self.parameters, 'temp_dir', None) or tempfile.gettempdir()  # both libraries share the same thumbnails cache dir
+        self.SourcesLibrary = SourcesThumbnailWidget(self.SourcesLibraryFrame, temp_dir=thumbnails_temp_dir, click_callback=self._set_source)
+        self.TargetsLibrary = TargetsThumbnailWidget(self.TargetsLibraryFrame, temp_dir=thumbnails_temp_dir, click_callback=self._set_target)
 
         # self.GUIModel.status_bar = self.StatusBar
 
@@ -250,6 +270,7 @@ class GUIForm(AttributeLoader):
         self.OperationsSubMenu.add(COMMAND, label='Reprocess', command=lambda: self.ProcessingModel.update_preview(True))  # type: ignore[no-untyped-call]  # it is a library method
 
         def _save_current_frame_command() -> None:
+            from tkinter import filedialog
             save_file = filedialog.asksaveasfilename(title='Save frame', defaultextension='png')
             if save_file != '':
                 self.ProcessingModel.Player.save_to_file(save_file)
@@ -286,9 +307,13 @@ class GUIForm(AttributeLoader):
         self.SoundSubMenu.add(SEPARATOR)  # type: ignore[no-untyped-call]  # it is a library method
         self.AudioBackendVar: StringVar = StringVar(value=self.ProcessingModel.audio_backend)
 
+        # the backends list is built on the first menu opening, so the GUI startup skips backends discovery
         self.AudioBackendSelectionMenu: Menu = Menu(self.SoundSubMenu, tearoff=False)
-        for available_backend in BaseAudioBackend.list():
-            self.AudioBackendSelectionMenu.add(RADIOBUTTON, variable=self.AudioBackendVar, label=available_backend, command=lambda: _switch_audio_backend_command(available_backend))  # type: ignore[no-untyped-call]  # it is a library method
+        self._build_on_first_post(self.AudioBackendSelectionMenu, lambda: _fill_audio_backend_menu())
+
+        def _fill_audio_backend_menu() -> None:
+            for available_backend in BaseAudioBackend.list():
+                self.AudioBackendSelectionMenu.add(RADIOBUTTON, variable=self.AudioBackendVar, label=available_backend, command=lambda backend=available_backend: _switch_audio_backend_command(backend))  # type: ignore[no-untyped-call]  # it is a library method
 
         def _switch_audio_backend_command(backend: str) -> None:
             self.ProcessingModel.audio_backend = backend
@@ -315,23 +340,45 @@ class GUIForm(AttributeLoader):
         self.TargetsLibraryMenu: Menu = Menu(self.LibraryMenu, tearoff=False)
         self.LibraryMenu.add(CASCADE, menu=self.SourcesLibraryMenu, label='Sources library')  # type: ignore[no-untyped-call]  # it is a library method
         self.LibraryMenu.add(CASCADE, menu=self.TargetsLibraryMenu, label='Targets library')  # type: ignore[no-untyped-call]  # it is a library method
-        self.SourcesLibraryMenu.add(COMMAND, label='Add files', command=lambda: self.add_source_files())  # type: ignore[no-untyped-call]  # it is a library method
-        self.SourcesLibraryMenu.add(COMMAND, label='Add a folder', command=lambda: self.add_source_folder())  # type: ignore[no-untyped-call]  # it is a library method
-        self.SourcesLibraryMenu.add(SEPARATOR)  # type: ignore[no-untyped-call]  # it is a library method
-        self.SourcesLibraryMenu.add(COMMAND, label='Clear', command=lambda: self.source_clear())  # type: ignore[no-untyped-call]  # it is a library method
-        self.TargetsLibraryMenu.add(COMMAND, label='Add files', command=lambda: self.add_target_files())  # type: ignore[no-untyped-call]  # it is a library method
-        self.TargetsLibraryMenu.add(COMMAND, label='Add a folder', command=lambda: self.add_target_folder())  # type: ignore[no-untyped-call]  # it is a library method
-        self.TargetsLibraryMenu.add(SEPARATOR)  # type: ignore[no-untyped-call]  # it is a library method
-        self.TargetsLibraryMenu.add(COMMAND, label='Clear', command=lambda: self.target_clear())  # type: ignore[no-untyped-call]  # it is a library method
+        self._build_on_first_post(self.SourcesLibraryMenu, lambda: _fill_sources_library_menu())
+        self._build_on_first_post(self.TargetsLibraryMenu, lambda: _fill_targets_library_menu())
+
+        def _fill_sources_library_menu() -> None:
+            self.SourcesLibraryMenu.add(COMMAND, label='Add files', command=self.add_source_files)  # type: ignore[no-untyped-call]  # it is a library method
+            self.SourcesLibraryMenu.add(COMMAND, label='Add a folder', command=self.add_source_folder)  # type: ignore[no-untyped-call]  # it is a library method
+            self.SourcesLibraryMenu.add(SEPARATOR)  # type: ignore[no-untyped-call]  # it is a library method
+            self.SourcesLibraryMenu.add(COMMAND, label='Clear', command=self.source_clear)  # type: ignore[no-untyped-call]  # it is a library method
+
+        def _fill_targets_library_menu() -> None:
+            self.TargetsLibraryMenu.add(COMMAND, label='Add files', command=self.add_target_files)  # type: ignore[no-untyped-call]  # it is a library method
+            self.TargetsLibraryMenu.add(COMMAND, label='Add a folder', command=self.add_target_folder)  # type: ignore[no-untyped-call]  # it is a library method
+            self.TargetsLibraryMenu.add(SEPARATOR)  # type: ignore[no-untyped-call]  # it is a library method
+            self.TargetsLibraryMenu.add(COMMAND, label='Clear', command=self.target_clear)  # type: ignore[no-untyped-call]  # it is a library method
 
         self.ModeMenu: Menu = Menu(self.MainMenu, tearoff=False)
         self.MainMenu.add(CASCADE, menu=self.ModeMenu, label='Processing Mode')  # type: ignore[no-untyped-call]  # it is a library method
         self.ProcessingModeVar: StringVar = StringVar(value=self.processing_mode)
-        self.ModeMenu.add(RADIOBUTTON, variable=self.ProcessingModeVar, label="Standalone", value=MODE_STANDALONE, command=lambda: self._switch_processing_mode_command(MODE_STANDALONE))  # type: ignore[no-untyped-call]  # it is a library method
-        self.ModeMenu.add(RADIOBUTTON, variable=self.ProcessingModeVar, label="Distributed", value=MODE_DISTRIBUTED, command=lambda: self._switch_processing_mode_command(MODE_DISTRIBUTED))  # type: ignore[no-untyped-call]  # it is a library method
+        self._build_on_first_post(self.ModeMenu, lambda: _fill_mode_menu())
+
+        def _fill_mode_menu() -> None:
+            self.ModeMenu.add(RADIOBUTTON, variable=self.ProcessingModeVar, label="Standalone", value=MODE_STANDALONE, command=partial(self._switch_processing_mode_command, MODE_STANDALONE))  # type: ignore[no-untyped-call]  # it is a library method
+            self.ModeMenu.add(RADIOBUTTON, variable=self.ProcessingModeVar, label="Distributed", value=MODE_DISTRIBUTED, command=partial(self._switch_processing_mode_command, MODE_DISTRIBUTED))  # type: ignore[no-untyped-call]  # it is a library method
 
         self.GUIWindow.configure(menu=self.MainMenu, tearoff=False)
 
+    @staticmethod
+    def _build_on_first_post(menu: Menu, builder: Callable[[], None]) -> None:
+        """
+        Defers the menu entries building until the menu is opened for the first time
+        :param menu: the (empty) menu
+        :param builder: the function, that adds entries into the menu
+        """
+        def _build() -> None:
+            menu.configure(postcommand='')
+            builder()
+
+        menu.configure(postcommand=_build)
+
     # maintain the order of window controls
     def draw_controls(self) -> None:
         """Draw controls in the window."""
@@ -387,8 +434,7 @@ class GUIForm(AttributeLoader):
         self.draw_controls()
         self.SourcePathEntry.set_text(self.ProcessingModel.source_path)
         self.TargetPathEntry.set_text(self.ProcessingModel.target_path)
-        self.StatusBar.item('Target resolution', str(self.ProcessingModel.metadata))
-        self.StatusBar.item('Render size', f"{self.ProcessingModel.quality}% ({self.ProcessingModel.metadata.render_resolution[0]}x{self.ProcessingModel.metadata.render_resolution[1]})")
+        self.update_render_size_status(with_target_resolution=True)
         self.ProcessingModel.update_preview()
         self.GUIWindow.wm_attributes("-topmost", self.topmost)
         self.ProcessingModel.Player.bring_to_front()
@@ -406,18 +452,28 @@ class GUIForm(AttributeLoader):
 
     def load_geometry(self) -> None:
         """Load window geometry from settings."""
-        self.GUIWindow.update()
-        self.GUIWindow.update_idletasks()
+        self.GUIWindow.update()  # also processes idle tasks, so the current geometry is actual
         current_size_part, _ = self.GUIWindow.geometry().split('+', 1)
         current_height = int(current_size_part.split('x')[1])
-        size_part, position_part = self.geometry.split('+', 1)
-        requested_width = int(size_part.split('x')[0])
-        self.GUIWindow.geometry(f"{requested_width}x{current_height}+{position_part}")
+        self.GUIWindow.geometry(f"{self._requested_width}x{current_height}+{self._requested_position}")
+
+    def save_geometry(self) -> None:
+        """Save window geometry and state to settings."""
+        self._save_geometry_after_id = None
+        geometry = self.GUIWindow.geometry()
+        state = self.GUIWindow.wm_state()
+        if state != 'zoomed' and geometry != self._last_geometry:
+            self._config.set_key(self.__class__.__name__, 'controls-geometry', geometry)
+            self._last_geometry = geometry
+        if state != self._last_state:
+            self._config.set_key(self.__class__.__name__, 'controls-state', state)
+            self._last_state = state
 
     # Source and target handling
     def change_source(self) -> bool:
         """Change source file through file dialog."""
-        selected_file = self.SelectSourceDialog.askopenfilename(title='Select a source', initialdir=self.ProcessingModel.source_dir)
+        from tkinter import filedialog
+        selected_file = filedialog.askopenfilename(title='Select a source', initialdir=self.ProcessingModel.source_dir)
         if selected_file != '':
             self._set_source(selected_file)
             return True
@@ -430,7 +486,8 @@ class GUIForm(AttributeLoader):
 
     def change_target(self) -> bool:
         """Change target file through file dialog."""
-        selected_file = self.SelectTargetDialog.askopenfilename(title='Select a target', initialdir=self.ProcessingModel.target_dir)
+        from tkinter import filedialog
+        selected_file = filedialog.askopenfilename(title='Select a target', initialdir=self.ProcessingModel.target_dir)
         if selected_file != '':
             self._set_target(selected_file)
             return True
@@ -443,25 +500,55 @@ class GUIForm(AttributeLoader):
         self.update_slider_bounds()
         self.TargetPathEntry.set_text(filename)
         self.on_quality_scale_change(self.ProcessingModel.quality)
-        self.StatusBar.item('Target resolution', str(self.ProcessingModel.metadata))
+        self.update_render_size_status(with_target_resolution=True)
 
     def update_slider_bounds(self) -> None:
         """Update navigation slider bounds based on frame count."""
         self.NavigateSlider.to = self.ProcessingModel.metadata.frames_count - 1
+        self._navigation_step = max(1, self.NavigateSlider.to // 100)
         self.NavigateSlider.position = 0
         if self.NavigateSlider.to > 0:
             self.NavigateSlider.enable()
         else:
             self.NavigateSlider.disable()
 
+    def on_navigate_slider_change(self, position: int) -> None:
+        """Handle navigation slider drag, rewinding once the slider settles."""
+        if self._rewind_after_id is not None:
+            self.GUIWindow.after_cancel(self._rewind_after_id)
+        self._rewind_after_id = self.GUIWindow.after(50, self._apply_rewind, position)
+
+    def _apply_rewind(self, position: int) -> None:
+        self._rewind_after_id = None
+        self.ProcessingModel.rewind(position)
+
     def on_quality_scale_change(self, frame_value: int) -> None:
-        """Handle change in quality scale."""
-        if frame_value > self.QualityScaleSpinbox.cget('to'):
-            frame_value = self.QualityScaleSpinbox.cget('to')
-        if frame_value < self.QualityScaleSpinbox.cget('from'):
-            frame_value = self.QualityScaleSpinbox.cget('from')
+        """Handle change in quality scale, applying it once the input settles."""
+        if self._quality_after_id is not None:
+            self.GUIWindow.after_cancel(self._quality_after_id)
+        self._quality_after_id = self.GUIWindow.after(120, self._apply_quality, frame_value)
+
+    def _apply_quality(self, frame_value: int) -> None:
+        self._quality_after_id = None
+        frame_value = min(max(frame_value, self._quality_min), self._quality_max)
         self.ProcessingModel.quality = frame_value
-        self.StatusBar.item('Render size', f"{self.ProcessingModel.quality}% ({self.ProcessingModel.metadata.render_resolution[0]}x{self.ProcessingModel.metadata.render_resolution[1]})")
+        self.update_render_size_status()
+
+    def update_render_size_status(self, with_target_resolution: bool = False) -> None:
+        """
+        Show render size in the status bar, if it is changed since the last update
+        :param with_target_resolution: also show the target resolution within the same status bar update
+        """
+        status: Dict[str, str] = {}
+        if with_target_resolution:
+            status['Target resolution'] = str(self.ProcessingModel.metadata)
+        render_info = (self.ProcessingModel.quality, self.ProcessingModel.metadata.render_resolution)
+        if render_info != self._last_render_info:
+            self._last_render_info = render_info
+            quality, (width, height) = render_info
+            status['Render size'] = f"{quality}% ({width}x{height})"
+        if status:
+            self.StatusBar.items(status)
 
     def source_library_add(self, paths: List[str], reload: bool = False) -> None:
         """
@@ -470,16 +557,11 @@ class GUIForm(AttributeLoader):
         :param reload: True for reloading library from given paths
         """
         if reload:
-            self.SourcesLibrary.clear_thumbnails()
-
-        for path in paths:
-            if is_dir(path):
-                for dir_file in get_directory_file_list(path, is_image):
-                    self.SourcesLibrary.add_thumbnail(source_path=dir_file)
-            else:
-                self.SourcesLibrary.add_thumbnail(source_path=path)
+            self._library_clear(self.SourcesLibrary)
+        self._library_add_paths(self.SourcesLibrary, paths, has_image_mimetype)
 
     def add_source_files(self) -> None:
+        from tkinter import filedialog
         image_extensions = get_type_extensions('image/')
         file_paths = filedialog.askopenfilenames(
             title="Select files to add to sources",
@@ -490,6 +572,7 @@ class GUIForm(AttributeLoader):
             self.source_library_add(paths=list(file_paths))
 
     def add_source_folder(self) -> None:
+        from tkinter import filedialog
         directory = filedialog.askdirectory(
             title="Select a directory to add sources",
             initialdir=self.ProcessingModel.source_dir
@@ -498,7 +581,7 @@ class GUIForm(AttributeLoader):
             self.source_library_add(paths=[directory])
 
     def source_clear(self) -> None:
-        self.SourcesLibrary.clear_thumbnails()
+        self._library_clear(self.SourcesLibrary)
 
     def target_library_add(self, paths: List[str], reload: bool = False) -> None:
         """
@@ -507,16 +590,11 @@ class GUIForm(AttributeLoader):
         :param reload: True for reloading library from given paths
         """
         if reload:
-            self.TargetsLibrary.clear_thumbnails()
-
-        for path in paths:
-            if is_dir(path):
-                for dir_file in get_directory_file_list(path, is_video):
-                    self.TargetsLibrary.add_thumbnail(source_path=dir_file)
-            else:
-                self.TargetsLibrary.add_thumbnail(source_path=path)
+            self._library_clear(self.TargetsLibrary)
+        self._library_add_paths(self.TargetsLibrary, paths, has_video_mimetype)
 
     def add_target_files(self) -> None:
+        from tkinter import filedialog
         file_paths = filedialog.askopenfilenames(
             title="Select files to add to targets",
             filetypes=[('All files', '*.*')],
@@ -526,6 +604,7 @@ class GUIForm(AttributeLoader):
             self.target_library_add(paths=list(file_paths))
 
     def add_target_folder(self) -> None:
+        from tkinter import filedialog
         directory = filedialog.askdirectory(
             title="Select a directory to add targets",
             initialdir=self.ProcessingModel.target_dir
@@ -534,7 +613,70 @@ class GUIForm(AttributeLoader):
             self.target_library_add(paths=[directory])
 
     def target_clear(self) -> None:
-        self.TargetsLibrary.clear_thumbnails()
+        self._library_clear(self.TargetsLibrary)
+
+    def _library_clear(self, library: BaseThumbnailWidget) -> None:
+        """
+        Clears the library and drops the results of directories scans, which are still running
+        :param library: the library widget
+        """
+        self._library_generations[library] = self._library_generations.get(library, 0) + 1
+        library.clear_thumbnails()
+
+    def _library_add_paths(self, library: BaseThumbnailWidget, paths: List[str], filter_: Callable[[str], bool]) -> None:
+        """
+        Adds files and directories contents to the library in the given order.
+        Directories are scanned in the background, the GUI thread polls the finished scans and adds found files
+        :param library: the library widget
+        :param paths: each path can point to a file or a directory
+        :param filter_: the directories files filter
+        """
+        generation = self._library_generations.get(library, 0)
+        pending: deque[Future[List[str]] | List[str]] = deque()  # scans and files lists in the order of paths
+        for path in paths:
+            if is_dir(path):
+                pending.append(self._io_pool.submit(self._scan_directory, path, filter_))
+            elif pending and isinstance(pending[-1], list):
+                pending[-1].append(path)
+            else:
+                pending.append([path])
+        self._library_deliver(library, generation, pending)  # files before the first directory are added at once
+
+    def _library_deliver(self, library: BaseThumbnailWidget, generation: int, pending: deque[Future[List[str]] | List[str]]) -> None:
+        """
+        Adds the leading finished items of pending to the library, so the paths order is kept.
+        Runs on the GUI thread and reschedules itself there, while scans are pending: Tk can't be called from the pool threads
+        :param library: the library widget
+        :param generation: the library generation at the moment the paths were given
+        :param pending: scans and files lists in the order of paths
+        """
+        if generation != self._library_generations.get(library, 0):  # the library was cleared after the paths were given
+            pending.clear()
+            return
+        files: List[str] = []
+        while pending and (isinstance(pending[0], list) or pending[0].done()):
+            item = pending.popleft()
+            if isinstance(item, list):
+                files.extend(item)
+            elif not item.cancelled():
+                files.extend(item.result())  # _scan_directory doesn't raise
+        if files:
+            library.add_thumbnails(source_paths=files)
+        if pending:
+            self.GUIWindow.after(100, self._library_deliver, library, generation, pending)
+
+    @staticmethod
+    def _scan_directory(path: str, filter_: Callable[[str], bool]) -> List[str]:
+        """
+        Returns the directory files list, scan errors are logged, because they can't reach the user from the pool
+        :param path: the directory path
+        :param filter_: the files filter
+        """
+        try:
+            return get_directory_file_list(path, filter_)
+        except Exception as exception:
+            app_logger.error(f"Can't scan {path}: {exception}")
+            return []
 
     def _switch_processing_mode_command(self, mode: str) -> None:
         """Switch processing mode and reinitialize the processing model."""
@@ -544,17 +686,21 @@ class GUIForm(AttributeLoader):
             self.ProcessingModel.player_stop(wait=True)
 
             # Переинициализируем модель обработки в зависимости от выбранного режима
-            if self.processing_mode == MODE_STANDALONE:
-                self.ProcessingModel = LocalProcessingModel(self.parameters, status_callback=lambda name, value: self.StatusBar.item(name, value), on_close_event=self._event_player_window_closed)
-            elif self.processing_mode == MODE_DISTRIBUTED:
-                self.ProcessingModel = RemoteProcessingModel(self.parameters, status_callback=lambda name, value: self.StatusBar.item(name, value), on_close_event=self._event_player_window_closed)
-            else:
-                raise Exception(f"Unknown mode: {self.processing_mode}")
+            self.ProcessingModel = self._create_processing_model()
             self.ProcessingModel.progress_control = self.NavigateSlider.progress
             # Обновляем интерфейс после смены модели
             self.NavigateSlider.configure(variable=self.ProcessingModel.position)
             self.VolumeSlider.configure(variable=self.ProcessingModel.volume)
             self.ProcessingModel.update_preview()
-            self.StatusBar.item('Target resolution', str(self.ProcessingModel.metadata))
-            self.StatusBar.item('Render size', f"{self.ProcessingModel.quality}% ({self.ProcessingModel.metadata.render_resolution[0]}x{self.ProcessingModel.metadata.render_resolution[1]})")
+            self.update_render_size_status(with_target_resolution=True)
             self.update_slider_bounds()
+
+    def _create_processing_model(self) -> ProcessingModelInterface:
+        """Create the processing model for the current processing mode, importing only the model in use."""
+        if self.processing_mode == MODE_STANDALONE:
+            from sinner.models.processing.LocalProcessingModel import LocalProcessingModel
+            return LocalProcessingModel(self.parameters, status_callback=lambda name, value: self.StatusBar.item(name, value), on_close_event=self._event_player_window_closed)
+        if self.processing_mode == MODE_DISTRIBUTED:
+            from sinner.models.processing.RemoteProcessingModel import RemoteProcessingModel
+            return RemoteProcessingModel(self.parameters, status_callback=lambda name, value: self.StatusBar.item(name, value), on_close_event=self._event_player_window_closed)
+        raise Exception(f"Unknown mode: {self.processing_mode}")
@@ -2,20 +2,28 @@ import ctypes
 import threading
 from ctypes import wintypes
 from time import sleep
-from typing import Callable
+from typing import Callable, Any
 
 import numpy
 import pygame
 from psutil import WINDOWS
 from pygame import Surface
 
-from sinner.gui.controls.FramePlayer.BaseFramePlayer import BaseFramePlayer, HWND_NOTOPMOST, HWND_TOPMOST, SWP_NOMOVE, SWP_NOSIZE, HWND_TOP, SWP_NOACTIVATE, ROTATE_90_CLOCKWISE, ROTATE_180, ROTATE_90_COUNTERCLOCKWISE
+from sinner.gui.controls.FramePlayer.BaseFramePlayer import BaseFramePlayer, HWND_NOTOPMOST, HWND_TOPMOST, SWP_NOMOVE, SWP_NOSIZE, HWND_TOP, SWP_NOACTIVATE, ROTATE_180, ROTATE_90_COUNTERCLOCKWISE
 from sinner.helpers.FrameHelper import resize_proportionally
 from sinner.models.Event import Event
 from sinner.typing import Frame
 from sinner.utilities import get_app_dir
 from pygame.event import Event as PygameEvent
 
+# the SetWindowPos binding is prepared once, instead of on every window position change
+_SetWindowPos: Callable[..., Any] | None = None
+if WINDOWS:
+    _user32 = ctypes.WinDLL("user32")  # type: ignore[attr-defined]  # platform issue
+    _user32.SetWindowPos.restype = wintypes.HWND
+    _user32.SetWindowPos.argtypes = [wintypes.HWND, wintypes.HWND, wintypes.INT, wintypes.INT, wintypes.INT, wintypes.INT, wintypes.UINT]
+    _SetWindowPos = _user32.SetWindowPos
+
 
 class PygameFramePlayer(BaseFramePlayer):
     screen: Surface
@@ -25,6 +33,7 @@ class PygameFramePlayer(BaseFramePlayer):
     on_close_event: Event | None
 
     _visible: bool = False
+    _blit_surface: Surface | None = None  # the surface reused to draw frames of the same size
     _events_thread: threading.Thread
     _event_handlers: dict[int, Callable[[PygameEvent], None]] = {}
     _event_processing: Event  # the flag to control start/stop event_handling thread
@@ -49,6 +58,7 @@ class PygameFramePlayer(BaseFramePlayer):
     def close(self) -> None:
         self._event_processing.clear()  # stop handlers
         # self.screen = None
+        self._blit_surface = None
         pygame.quit()
         if self.on_close_event:
             self.on_close_event.set()
@@ -65,10 +75,10 @@ class PygameFramePlayer(BaseFramePlayer):
         self._reload_event_handlers()
         while self._event_processing.is_set():
             for event in pygame.event.get():
-                if event.type in self._event_handlers:
-                    handler = self._event_handlers[event.type]
+                handler = self._event_handlers.get(event.type)
+                if handler is not None:
                     handler(event)
-            sleep(0.01)  # should prevent a high CPU load
+            sleep(0.05)  # pygame.event.wait() polls every millisecond inside SDL, so the sleeping loop wakes up less often
 
     def show(self) -> None:
         if not self._visible:
@@ -79,7 +89,7 @@ class PygameFramePlayer(BaseFramePlayer):
             self.bring_to_front()
 
     def hide(self) -> None:
-        if self.screen is not None:
+        if self._visible:  # set_mode recreates the window, so it is skipped if the window is already hidden
             self.screen = pygame.display.set_mode((self.width, self.height), pygame.HIDDEN)
         self._visible = False
 
@@ -89,7 +99,9 @@ class PygameFramePlayer(BaseFramePlayer):
             frame = self._last_frame
         if frame is not None:
             self._last_frame = frame
-            frame = frame[::-1, :, [2, 1, 0]]  # swaps colors channels from BGR to RGB, flips the frame to a pygame coordinates
+            # swaps colors channels from BGR to RGB.
+            # Slicing makes a strided view without any copying, surfarray accepts it as is
+            frame = frame[:, :, ::-1]
 
             # it's always required rotate frames for pygame to match the X coordinate
             frame = self._rotate_frame(frame)
@@ -101,15 +113,25 @@ class PygameFramePlayer(BaseFramePlayer):
             elif resize is False:  # resize the player to the image size
                 self.adjust_size(redraw=False)
 
-            image_surface = pygame.surfarray.make_surface(frame)
-            self.screen.blit(image_surface, ((self.screen.get_width() - frame.shape[0]) // 2, (self.screen.get_height() - frame.shape[1]) // 2))
+            # the surface is recreated only when the frame size changes, otherwise the frame is copied into the existing one.
+            # The 24-bit surface has the same pixel layout as the frame, so the copy is a plain memory copy into its buffer
+            # The surface is read once: show_frame() is also called from the events thread on the window resize,
+            # so the attribute can be replaced by the other thread at any moment
+            surface = self._blit_surface
+            if surface is None or surface.get_size() != frame.shape[:2]:
+                surface = self._blit_surface = Surface(frame.shape[:2], 0, 24)
+                self.screen.fill((0, 0, 0))  # the letterbox is cleared only when the frame size changes, same size frames cover each other
+            pixels = pygame.surfarray.pixels3d(surface)
+            numpy.copyto(pixels, frame)
+            del pixels  # unlocks the surface before the blit
+            self.screen.blit(surface, ((self.screen.get_width() - frame.shape[0]) // 2, (self.screen.get_height() - frame.shape[1]) // 2))
             pygame.display.flip()
 
     def adjust_size(self, redraw: bool = True, size: tuple[int, int] | None = None) -> None:
         if size is None:
             if self._last_frame is not None:
                 size = self._last_frame.shape[1], self._last_frame.shape[0]
-        if size is not None:
+        if size is not None and (not self._visible or self.screen.get_size() != size):
             # note: set_mode size parameter has the WIDTH, HEIGHT dimensions order
             self.screen = pygame.display.set_mode(size, pygame.RESIZABLE)
             # it is required to redraw the frame after resize, if it is not be intended after
@@ -125,31 +147,27 @@ class PygameFramePlayer(BaseFramePlayer):
         pygame.display.toggle_fullscreen()
 
     def set_topmost(self, on_top: bool = True) -> None:
-        if WINDOWS:
-            if 'window' in pygame.display.get_wm_info():
-                user32 = ctypes.WinDLL("user32")  # type: ignore[attr-defined]  # platform issue
-                user32.SetWindowPos.restype = wintypes.HWND
-                user32.SetWindowPos.argtypes = [wintypes.HWND, wintypes.HWND, wintypes.INT, wintypes.INT, wintypes.INT, wintypes.INT, wintypes.UINT]
-                user32.SetWindowPos(pygame.display.get_wm_info()['window'], HWND_TOPMOST if on_top else HWND_NOTOPMOST, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE)
+        self._set_window_pos(HWND_TOPMOST if on_top else HWND_NOTOPMOST, SWP_NOMOVE | SWP_NOSIZE)
 
     def bring_to_front(self) -> None:
-        if WINDOWS:
-            if 'window' in pygame.display.get_wm_info():
-                user32 = ctypes.WinDLL("user32")  # type: ignore[attr-defined]  # platform issue
-                user32.SetWindowPos.restype = wintypes.HWND
-                user32.SetWindowPos.argtypes = [wintypes.HWND, wintypes.HWND, wintypes.INT, wintypes.INT, wintypes.INT, wintypes.INT, wintypes.UINT]
-                user32.SetWindowPos(pygame.display.get_wm_info()['window'], HWND_TOP, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE)
-
-    # the method is overlapped because pygame uses inverted X coordinate
+        self._set_window_pos(HWND_TOP, SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE)
+
+    @staticmethod
+    def _set_window_pos(insert_after: int, flags: int) -> None:
+        if _SetWindowPos is not None:
+            window = pygame.display.get_wm_info().get('window')
+            if window is not None:
+                _SetWindowPos(window, insert_after, 0, 0, 0, 0, flags)
+
+    # the method is overlapped because pygame surfarray uses X, Y axes order instead of frames HEIGHT, WIDTH order,
+    # so each rotation is mapped to a single strided view of the frame
     def _rotate_frame(self, frame: Frame, rotate_mode: int | None = None) -> Frame:
         if rotate_mode is None:
             rotate_mode = self._rotate
         if rotate_mode is None:
-            return numpy.rot90(frame, k=3)
-        if rotate_mode == ROTATE_90_CLOCKWISE:
-            return frame
+            return frame.transpose(1, 0, 2)
         if rotate_mode is ROTATE_180:
-            return numpy.rot90(frame)
+            return frame.transpose(1, 0, 2)[::-1, ::-1]
         if rotate_mode == ROTATE_90_COUNTERCLOCKWISE:
-            return numpy.rot90(frame, k=2)
-        return frame
+            return frame[:, ::-1]
+        return frame[::-1]  # ROTATE_90_CLOCKWISE
@@ -1,3 +1,4 @@
+import time
 from tkinter import DISABLED, NORMAL, IntVar
 from typing import Any
 
@@ -9,9 +10,14 @@ from sinner.gui.controls.ProgressIndicator.DummyProgressIndicator import DummyPr
 from sinner.gui.controls.ProgressIndicator.SegmentedProgressBar import SegmentedProgressBar
 from sinner.models.processing.ProcessingModelInterface import PROCESSING, PROCESSED, EXTRACTED, EMPTY
 
+REDRAW_INTERVAL = 1 / 60  # the minimal interval between slider redraws, seconds
+
 
 class FrameSlider(CTkSlider, BaseFramePosition):
     progress: BaseProgressIndicator
+    _drawn_value: float | None = None  # the normalized value, the slider is drawn with
+    _draw_scheduled: bool = False  # the redraw is already waiting for the idle time
+    _last_draw_time: float = 0  # the monotonic time of the last redraw
 
     def __init__(self, master: Any, progress: bool = True, **kwargs):  # type: ignore[no-untyped-def]
         progress_height = 10
@@ -70,19 +76,39 @@ class FrameSlider(CTkSlider, BaseFramePosition):
             elif output_value > self._from_:
                 output_value = self._from_
 
-        self._output_value = self._round_to_step_size(output_value)
+        if self._number_of_steps is None and isinstance(self._variable, IntVar):
+            self._output_value = int(output_value)  # frame positions are integer, so there's nothing to round
+        else:
+            self._output_value = self._round_to_step_size(output_value)
         try:
             self._value = (self._output_value - self._from_) / (self._to - self._from_)
         except ZeroDivisionError:
             self._value = 1
 
-        self._draw()
+        # set() can be called on every played frame, so redraws are skipped for the same value and coalesced per idle cycle
+        if self._value != self._drawn_value and not self._draw_scheduled:
+            self._draw_scheduled = True
+            self.after_idle(self._draw_scheduled_value)
 
         if self._variable is not None and not from_variable_callback:
             self._variable_callback_blocked = True
             self._variable.set(round(self._output_value) if isinstance(self._variable, IntVar) else self._output_value)
             self._variable_callback_blocked = False
 
+    def _draw_scheduled_value(self) -> None:
+        delay = self._last_draw_time + REDRAW_INTERVAL - time.monotonic()
+        if delay > 0:  # postpones the redraw to keep the redraw rate limited, the last value is drawn anyway
+            self.after(int(delay * 1000) + 1, self._draw_scheduled_value)
+            return
+        self._draw_scheduled = False
+        if self._value != self._drawn_value:
+            self._draw()
+
+    def _draw(self, no_color_updates: bool = False) -> None:
+        super()._draw(no_color_updates)
+        self._drawn_value = self._value
+        self._last_draw_time = time.monotonic()
+
     @property
     def to(self) -> int:
         return self._to
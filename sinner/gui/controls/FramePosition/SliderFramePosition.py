@@ -11,6 +11,7 @@ class SliderFramePosition(BaseFramePosition, CTkSlider):
     _position_label: Label
     _current_position: StringVar
     _cmd: Union[Callable[[float], None], None] = None
+    _position_update_scheduled: bool = False  # the position label update is already waiting for the idle time
 
     def __init__(self, master: Misc | None, **kwargs):  # type: ignore[no-untyped-def]
         self._container = Frame(master, borderwidth=2)
@@ -45,7 +46,10 @@ class SliderFramePosition(BaseFramePosition, CTkSlider):
             elif output_value > self._from_:
                 output_value = self._from_
 
-        self._output_value = self._round_to_step_size(output_value)
+        if self._number_of_steps is None and isinstance(self._variable, IntVar):
+            self._output_value = int(output_value)  # frame positions are integer, so there's nothing to round
+        else:
+            self._output_value = self._round_to_step_size(output_value)
         try:
             self._value = (self._output_value - self._from_) / (self._to - self._from_)
         except ZeroDivisionError:
@@ -57,6 +61,16 @@ class SliderFramePosition(BaseFramePosition, CTkSlider):
             self._variable_callback_blocked = True
             self._variable.set(round(self._output_value) if isinstance(self._variable, IntVar) else self._output_value)
             self._variable_callback_blocked = False
+        self._schedule_position_update()
+
+    def _schedule_position_update(self) -> None:
+        # set() can be called on every played frame, so label updates are coalesced into one per idle cycle
+        if not self._position_update_scheduled:
+            self._position_update_scheduled = True
+            self._position_label.after_idle(self._flush_position_update)
+
+    def _flush_position_update(self) -> None:
+        self._position_update_scheduled = False
         self.update_position()
 
     def update_position(self) -> None:
@@ -1,5 +1,5 @@
 from tkinter import Frame, BOTTOM, Misc, X, EW
-from typing import Dict
+from typing import Dict, List, Tuple
 
 from sinner.gui.controls.TextBox import TextBox
 from sinner.gui.controls.Tooltip import Tooltip
@@ -25,6 +25,25 @@ class StatusBar(Frame):
             cell = self.create_cell(name, value, span)
         return cell
 
+    def items(self, items: Dict[str, str]) -> None:
+        """
+        Updates several cells at once with a single scheduled GUI update
+        :param items: cells names and values
+        """
+        updates: List[Tuple[TextBox, str]] = []
+        for name, value in items.items():
+            if name in self.cells:
+                updates.append((self.cells[name], value))
+            else:
+                self.create_cell(name, value)
+        if updates:
+            self.after(0, self._update_cells, updates)
+
+    @staticmethod
+    def _update_cells(updates: List[Tuple[TextBox, str]]) -> None:
+        for cell, value in updates:
+            cell.update_text(value)
+
     def create_cell(self, name: str, value: str, span: int = 1) -> TextBox:
         self.grid_columnconfigure(len(self.cells), weight=1)
         cell = TextBox(self, state="readonly")
@@ -6,7 +6,7 @@ from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor, Future
 from multiprocessing import cpu_count
 from tkinter import Canvas, Frame, Misc, NSEW, Scrollbar, Label, N, UNITS, ALL, Event, NW, LEFT, Y, BOTH, TOP, X, Entry, StringVar
-from typing import List, Callable, Optional, Set
+from typing import List, Callable, Optional, Set, Dict, Tuple, Any
 
 from PIL import Image
 from PIL.ImageTk import PhotoImage
@@ -18,6 +18,8 @@ from sinner.gui.controls.ThumbnailWidget.ThumbnailData import ThumbnailData
 from sinner.gui.controls.ThumbnailWidget.ThumbnailItem import ThumbnailItem
 from sinner.utilities import normalize_path
 
+THUMBNAIL_WORKERS_LIMIT = 8  # Максимальное число потоков подготовки миниатюр на виджет
+
 
 class BaseThumbnailWidget(Frame, ABC):
     thumbnails: List[ThumbnailItem]
@@ -55,12 +57,14 @@ class BaseThumbnailWidget(Frame, ABC):
         self._filtered_thumbnails = self.thumbnails.copy()  # Инициализация фильтрованного списка
         self.thumbnail_paths = set()
         self.selected_paths = set()
+        self._pixel_count_cache: Dict[str, int] = {}  # Размеры исходных файлов, чтобы не открывать их повторно
 
         # Параметры сортировки по умолчанию
         self._current_sort_field = SortField.NAME
         self._current_sort_ascending = True
 
-        self._executor = ThreadPoolExecutor(max_workers=cpu_count())
+        # Подготовка миниатюр упирается в чтение с диска, поэтому большее число потоков не ускоряет загрузку
+        self._executor = ThreadPoolExecutor(max_workers=min(THUMBNAIL_WORKERS_LIMIT, cpu_count()))
         self._pending_futures: List[Future[ThumbnailData | None]] = []
         self._processing_lock = threading.Lock()
         self._is_processing = False
@@ -179,6 +183,17 @@ class BaseThumbnailWidget(Frame, ABC):
                 return img.copy()
         return None
 
+    @staticmethod
+    def get_thumbnail_info(thumbnail: Image.Image) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Reads the metadata of the cached thumbnail in one pass
+        :param thumbnail: the cached thumbnail
+        :return: the caption and the pixel count, None if not stored
+        """
+        info = thumbnail.info
+        pixel_count_raw: Any = info.get("pixel_count")
+        return info.get("caption"), int(pixel_count_raw) if pixel_count_raw else None
+
     def set_cached_thumbnail(self, source_path: str, img: Image.Image, caption: Optional[str] = None, pixel_count: Optional[int] = None) -> None:
         thumb_name = hashlib.md5(f"{source_path}{self.thumbnail_size}".encode()).hexdigest() + '.png'
         thumb_path = os.path.join(self.temp_dir, thumb_name)
@@ -211,37 +226,54 @@ class BaseThumbnailWidget(Frame, ABC):
         image.thumbnail((size, size))
         return image
 
-    @abstractmethod
     def add_thumbnail(self, source_path: str, click_callback: Optional[Callable[[str], None]] = None) -> None:
         """
         Adds an image thumbnail to the widget if it doesn't already exist
             :param source_path: source file path
             :param click_callback: on thumbnail click callback. None: global callback will be used
             """
-        # Normalize the path for consistent comparison
-        normalized_path = str(normalize_path(source_path))
+        self.add_thumbnails([source_path], click_callback)
 
-        # Check if this normalized path already exists in our thumbnails
-        # Direct comparison allow same path to be added, but any other way will increase code complexity to O(log(n)))
-        if normalized_path in self.thumbnail_paths:
-            # We already have this path, skip processing
-            return
+    def add_thumbnails(self, source_paths: List[str], click_callback: Optional[Callable[[str], None]] = None) -> None:
+        """
+        Adds a batch of thumbnails to the widget, skipping already existing ones, with a single GUI update scheduling
+            :param source_paths: source files paths
+            :param click_callback: on thumbnail click callback. None: global callback will be used
+            """
+        futures: List[Future[ThumbnailData | None]] = []
+        for source_path in source_paths:
+            if not self.is_acceptable(source_path):
+                continue
+            # Normalize the path for consistent comparison
+            normalized_path = str(normalize_path(source_path))
 
-        # Add the normalized path to our tracking set
-        self.thumbnail_paths.add(normalized_path)
+            # Check if this normalized path already exists in our thumbnails
+            # Direct comparison allow same path to be added, but any other way will increase code complexity to O(log(n)))
+            if normalized_path in self.thumbnail_paths:
+                # We already have this path, skip processing
+                continue
 
-        # Подготавливаем параметры для обработки
-        params = (source_path, click_callback or self._thumbnail_click_callback)
+            # Add the normalized path to our tracking set
+            self.thumbnail_paths.add(normalized_path)
 
-        # Создаём задачу для обработки изображения
-        future = self._executor.submit(self._prepare_thumbnail_data, *params)
+            # Создаём задачу для обработки изображения
+            futures.append(self._executor.submit(self._prepare_thumbnail_data, normalized_path, click_callback or self._thumbnail_click_callback))
 
+        if not futures:
+            return
         with self._processing_lock:
-            self._pending_futures.append(future)
+            self._pending_futures.extend(futures)
             if not self._is_processing:
                 self._is_processing = True
                 self.after(100, self._process_pending)
 
+    def is_acceptable(self, source_path: str) -> bool:
+        """
+        Checks if the file can be shown in the widget
+        :param source_path: source file path
+        """
+        return True
+
     def select_thumbnail(self, path: str, exclusive: bool = True) -> None:
         """
         Выделяет миниатюру по указанному пути к файлу
@@ -419,6 +451,7 @@ class BaseThumbnailWidget(Frame, ABC):
     def _prepare_thumbnail_data(self, source_path: str, click_callback: Optional[Callable[[str], None]] = None) -> Optional[ThumbnailData]:
         """
         Prepare thumbnail data in background thread
+        :param source_path: the normalized source file path
         """
         pass
 
@@ -466,7 +499,7 @@ class BaseThumbnailWidget(Frame, ABC):
                     caption_label=caption_label,
                     data=thumb_data
                 ))
-                self.thumbnail_paths.add(str(normalize_path(thumb_data.path)))
+                self.thumbnail_paths.add(thumb_data.path)  # the path is already normalized
 
                 # Создаем обработчик клика, учитывающий модификаторы клавиатуры для множественного выделения
                 def selection_click_handler(event: Event, path: str = thumb_data.path) -> None:  # type: ignore[union-attr, type-arg]  # thumb_data always defined here
@@ -1,40 +1,40 @@
-from typing import Callable, Optional, Any
+from typing import Callable, Optional
 
 from PIL import Image
 
 from sinner.gui.controls.ThumbnailWidget.BaseThumbnailWidget import BaseThumbnailWidget
 from sinner.gui.controls.ThumbnailWidget.ThumbnailData import ThumbnailData
-from sinner.utilities import is_image, get_file_name, normalize_path
+from sinner.utilities import is_image, get_file_name
 
 
 class SourcesThumbnailWidget(BaseThumbnailWidget):
 
-    def add_thumbnail(self, source_path: str, click_callback: Optional[Callable[[str], None]] = None) -> None:
-        """
-        Adds an image thumbnail to the widget
-        :param source_path: image file path
-        :param click_callback: on thumbnail click callback. None: global callback will be used
-        """
-        if is_image(source_path):
-            super().add_thumbnail(source_path, click_callback)
+    def is_acceptable(self, source_path: str) -> bool:
+        return is_image(source_path)
 
     def _prepare_thumbnail_data(self, source_path: str, click_callback: Optional[Callable[[str], None]] = None) -> Optional[ThumbnailData]:
         """
         Prepare thumbnail data in background thread
+        :param source_path: the normalized source file path
         """
-        source_path = str(normalize_path(source_path))
         thumbnail = self.get_cached_thumbnail(source_path)
-        if not thumbnail:
+        pixel_count: Optional[int]
+        if thumbnail:
+            caption, pixel_count = self.get_thumbnail_info(thumbnail)
+            caption = caption or get_file_name(source_path)
+            pixel_count = pixel_count or self._pixel_count_cache.get(source_path)
+            if pixel_count is None:  # the thumbnail was cached without the pixel count
+                with Image.open(source_path) as img:  # only the header is read, pixels are not decoded
+                    pixel_count = img.size[0] * img.size[1]
+                # the cached thumbnail is updated, so next runs will not open the source file again
+                self.set_cached_thumbnail(source_path, thumbnail, caption=caption, pixel_count=pixel_count)
+        else:
             with Image.open(source_path) as img:
                 thumbnail = self.get_thumbnail(img, self.thumbnail_size)
-                pixel_count: Optional[int] = img.size[0] * img.size[1]
-            self.set_cached_thumbnail(source_path, thumbnail, caption=get_file_name(source_path), pixel_count=pixel_count)
-        pixel_count_raw: Any = thumbnail.info.get("pixel_count")
-        pixel_count = int(pixel_count_raw) if pixel_count_raw else None
-        caption = thumbnail.info.get("caption") or get_file_name(source_path)
-        if pixel_count is None:
-            with Image.open(source_path) as img:
                 pixel_count = img.size[0] * img.size[1]
+            caption = get_file_name(source_path)
+            self.set_cached_thumbnail(source_path, thumbnail, caption=caption, pixel_count=pixel_count)
+        self._pixel_count_cache[source_path] = pixel_count
         return ThumbnailData(
             thumbnail=thumbnail,
             path=source_path,
@@ -1,15 +1,14 @@
 from argparse import Namespace
-from typing import Callable, Tuple, Optional, Any
+from typing import Callable, Tuple, Optional
 
 import cv2
 from PIL import Image
 
 from sinner.gui.controls.ThumbnailWidget.BaseThumbnailWidget import BaseThumbnailWidget
 from sinner.gui.controls.ThumbnailWidget.ThumbnailData import ThumbnailData
-from sinner.handlers.frame.VideoHandler import VideoHandler
 from sinner.helpers.FrameHelper import resize_proportionally
 from sinner.typing import Frame
-from sinner.utilities import is_video, is_image, get_file_name, normalize_path
+from sinner.utilities import get_file_name, is_file, has_video_mimetype, has_image_mimetype
 
 
 class TargetsThumbnailWidget(BaseThumbnailWidget):
@@ -30,18 +29,16 @@ class TargetsThumbnailWidget(BaseThumbnailWidget):
     def _prepare_thumbnail_data(self, source_path: str, click_callback: Optional[Callable[[str], None]] = None) -> Optional[ThumbnailData]:
         """
         Prepare thumbnail data in background thread
+        :param source_path: the normalized source file path
         """
-        source_path = str(normalize_path(source_path))
         thumbnail = self.get_cached_thumbnail(source_path)
         if thumbnail:
-            caption = thumbnail.info.get("caption")
-            pixel_count_raw: Any = thumbnail.info.get("pixel_count")
-            pixel_count = int(pixel_count_raw) if pixel_count_raw else None
-        else:
-            if is_video(source_path):
+            caption, pixel_count = self.get_thumbnail_info(thumbnail)
+        elif is_file(source_path):  # the file is checked once, then only its mimetype matters
+            if has_video_mimetype(source_path):
                 frame, caption, pixel_count = self.get_frame(source_path)
-                thumbnail = Image.fromarray(cv2.cvtColor(resize_proportionally(frame, (self.thumbnail_size, self.thumbnail_size)), cv2.COLOR_BGR2RGB))
-            elif is_image(source_path):
+                thumbnail = Image.fromarray(cv2.cvtColor(resize_proportionally(frame, (self.thumbnail_size, self.thumbnail_size), cv2.INTER_AREA), cv2.COLOR_BGR2RGB))
+            elif has_image_mimetype(source_path):
                 with Image.open(source_path) as img:
                     thumbnail = img.copy()
                 pixel_count = thumbnail.size[0] * thumbnail.size[1]
@@ -50,6 +47,8 @@ class TargetsThumbnailWidget(BaseThumbnailWidget):
             else:
                 return None
             self.set_cached_thumbnail(source_path, thumbnail, caption, pixel_count)
+        else:
+            return None
         return ThumbnailData(
             thumbnail=thumbnail,
             path=source_path,
@@ -59,8 +58,18 @@ class TargetsThumbnailWidget(BaseThumbnailWidget):
         )
 
     def get_frame(self, video_path: str) -> Tuple[Frame, str, int]:
-        handler = VideoHandler(video_path, self.parameters)
-        fc = int(handler.fc * self.frame_position)
-        caption = f"{get_file_name(video_path)} [{handler.resolution[0]}x{handler.resolution[1]}]"
-        pixel_count = handler.resolution[0] * handler.resolution[1]
-        return handler.extract_frame(fc).frame, caption, pixel_count
+        # a single capture is used to read both the video properties and the frame
+        capture = cv2.VideoCapture(video_path)
+        try:
+            if not capture.isOpened():
+                raise Exception(f"Error opening {video_path}")
+            width = int(capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            fc = int(capture.get(cv2.CAP_PROP_FRAME_COUNT) * self.frame_position)
+            capture.set(cv2.CAP_PROP_POS_FRAMES, max(fc - 1, 0))  # zero-based frames
+            ret, frame = capture.read()
+        finally:
+            capture.release()
+        if not ret:
+            raise Exception(f"Error reading frame {fc} of {video_path}")
+        return frame, f"{get_file_name(video_path)} [{width}x{height}]", width * height
@@ -1,4 +1,3 @@
-import glob
 import os
 from abc import ABC, abstractmethod
 from argparse import Namespace
@@ -8,7 +7,7 @@ from sinner.handlers.writers.BaseImageWriter import BaseImageWriter
 from sinner.models.NumberedFrame import NumberedFrame
 from sinner.validators.AttributeLoader import Rules, AttributeLoader
 from sinner.typing import NumeratedFramePath
-from sinner.utilities import load_class, get_file_name, is_file, normalize_path
+from sinner.utilities import load_class, normalize_path
 
 
 class BaseFrameHandler(AttributeLoader, ABC):
@@ -113,8 +112,23 @@ class BaseFrameHandler(AttributeLoader, ABC):
         :param frames_range: sets the range of returned (and extracted) frames
         :return: list of requested frames
         """
-        frames_path = sorted(glob.glob(os.path.join(glob.escape(path), f'*{self._writer.extension}')))
-        return [(int(get_file_name(file_path)), file_path) for file_path in frames_path if is_file(file_path)][frames_range[0]:frames_range[1]]
+        return self._scan_frames_paths(path)[frames_range[0]:frames_range[1]]
+
+    def _scan_frames_paths(self, path: str) -> List[NumeratedFramePath]:
+        """
+        Lists the frames files in the directory in one scandir pass, sorted by their indices
+        :param path: the frames directory
+        :return: list of (frame index, frame path)
+        """
+        extension = self._writer.extension
+        extension_length = len(extension)
+        try:
+            with os.scandir(path) as entries:
+                frames_paths = [(int(entry.name[:-extension_length]), entry.path) for entry in entries if entry.name.endswith(extension) and entry.is_file()]
+        except FileNotFoundError:  # nothing was extracted
+            return []
+        frames_paths.sort()
+        return frames_paths
 
     @abstractmethod
     def extract_frame(self, frame_number: int) -> NumberedFrame:
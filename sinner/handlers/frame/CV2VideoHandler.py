@@ -1,8 +1,11 @@
 import glob
 import os.path
+import threading
+from argparse import Namespace
+from collections import deque
 from pathlib import Path
-from typing import List, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed, Future
+from typing import List, Any, Iterator, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed, Future, wait, FIRST_COMPLETED
 import cv2
 import psutil
 from cv2 import VideoCapture
@@ -14,7 +17,7 @@ from sinner.handlers.frame.EOutOfRange import EOutOfRange
 from sinner.helpers.FrameHelper import read_from_image
 from sinner.models.NumberedFrame import NumberedFrame
 from sinner.typing import NumeratedFramePath, Frame
-from sinner.utilities import get_file_name, is_file, get_mem_usage, suggest_max_memory
+from sinner.utilities import get_mem_usage, suggest_max_memory
 from sinner.validators.AttributeLoader import Rules
 
 
@@ -23,7 +26,17 @@ class CV2VideoHandler(BaseFrameHandler):
     max_memory: int
     memory_usage: bool
 
-    _statistics: dict[str, int] = {'mem_rss_max': 0, 'mem_vms_max': 0, 'limits_reaches': 0}
+    _statistics: dict[str, int] = {'mem_rss_max': 0, 'mem_vms_max': 0, 'limits_reaches': 0, 'backpressure_events': 0}
+
+    MEMORY_SAMPLE_INTERVAL: int = 16  # get_postfix() re-reads the memory usage once per that many calls
+    SEEK_THRESHOLD: int = 60  # max frames to decode forward in extract_frame() instead of seeking
+
+    _postfix_calls: int = 0
+    _memory_usage_sample: Optional[str] = None  # the last sampled memory usage string
+
+    _capture: Optional[VideoCapture] = None
+    _last_decoded_index: Optional[int] = None  # the frame index the shared capture has been read at
+    _capture_lock: threading.Lock
 
     def rules(self) -> Rules:
         return [
@@ -50,36 +63,68 @@ class CV2VideoHandler(BaseFrameHandler):
     def available() -> bool:
         return "FFMPEG" in cv2.getBuildInformation()
 
+    def __init__(self, target_path: str, parameters: Namespace):
+        self._capture_lock = threading.Lock()
+        super().__init__(target_path, parameters)
+
     def open(self) -> VideoCapture:
-        cap = cv2.VideoCapture(self._target_path)
+        cap = cv2.VideoCapture(self._target_path, cv2.CAP_FFMPEG)  # the backend is guaranteed by available(), so other backends aren't probed
         if not cap.isOpened():
             raise Exception("Error opening frame file")
         return cap
 
+    def _shared_capture(self) -> VideoCapture:
+        """
+        Returns the capture, which is kept open between metadata reads and frame extractions.
+        Must be called with the _capture_lock acquired
+        """
+        if self._capture is None:
+            self._capture = self.open()
+        return self._capture
+
+    def _read_metadata(self) -> Tuple[float, int, tuple[int, int]]:
+        """
+        Reads fps, frames count and resolution in one pass
+        """
+        with self._capture_lock:
+            capture = self._shared_capture()
+            fps = capture.get(cv2.CAP_PROP_FPS)
+            fc = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))  # cv2.CAP_PROP_FRAME_COUNT returns value from the video header, which not always correct. In this case we need to search last good frame
+            resolution = (int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)), int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+        return fps, fc, resolution
+
     @property
     def fps(self) -> float:
         if self._fps is None:
-            capture = self.open()
-            self._fps = capture.get(cv2.CAP_PROP_FPS)
-            capture.release()
+            self._fps, self._fc, self._resolution = self._read_metadata()
         return self._fps
 
     @property
     def fc(self) -> int:  # this value can be inaccurate
         if self._fc is None:
-            capture = self.open()
-            self._fc = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))  # cv2.CAP_PROP_FRAME_COUNT returns value from the video header, which not always correct. In this case we need to search last good frame
-            capture.release()
+            self._fps, self._fc, self._resolution = self._read_metadata()
         return self._fc
 
     @property
     def resolution(self) -> tuple[int, int]:
         if self._resolution is None:
-            capture = self.open()
-            self._resolution = (int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)), int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)))
-            capture.release()
+            self._fps, self._fc, self._resolution = self._read_metadata()
         return self._resolution
 
+    def close(self) -> None:
+        """
+        Releases the shared capture, it will be reopened on the next request
+        """
+        with self._capture_lock:
+            if self._capture is not None:
+                self._capture.release()
+                self._capture = None
+                self._last_decoded_index = None
+
+    def __del__(self) -> None:
+        if self._capture is not None:
+            self._capture.release()
+
     def get_frames_paths(self, path: str, frames_range: tuple[int | None, int | None] = (None, None)) -> List[NumeratedFramePath]:
         def write_done(future_: Future[bool]) -> None:
             futures.remove(future_)
@@ -90,11 +135,13 @@ class CV2VideoHandler(BaseFrameHandler):
         start = frames_range[0] if frames_range[0] is not None else 0
         stop = frames_range[1] if frames_range[1] is not None else self.fc - 1
 
-        with ThreadPoolExecutor(max_workers=psutil.cpu_count()) as executor:  # use one worker per cpu core
+        workers = psutil.cpu_count()
+        high_watermark = workers * 2  # decoding pauses, when that many frames are waiting to be written...
+        low_watermark = workers  # ...and continues, when the queue drains to that size
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:  # use one worker per cpu core
             futures: list[Future[bool]] = []
-            future_to_frame = {}
-            capture = self.open()
-            capture.set(cv2.CAP_PROP_POS_FRAMES, start)
+            future_to_frame: dict[Future[bool], NumeratedFramePath] = {}
             filename_length = len(str(self.fc))
             Path(path).mkdir(parents=True, exist_ok=True)
 
@@ -107,11 +154,7 @@ class CV2VideoHandler(BaseFrameHandler):
                     bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}{postfix}]',
                     initial=start
             ) as progress:
-                for frame_index in range(start, stop + 1):  # increase stop as it required by range() logic
-                    frame: Frame
-                    ret, frame = capture.read()
-                    if not ret:
-                        break
+                for frame_index, frame in self._read_frames(start, stop):
                     filename: str = os.path.join(path, str(frame_index).zfill(filename_length) + self._writer.extension)
                     # Submit only the write_to_image function to the executor, excluding it processing time from the loop
                     future: Future[bool] = executor.submit(self._writer.write, frame, filename)
@@ -119,23 +162,46 @@ class CV2VideoHandler(BaseFrameHandler):
                     futures.append(future)
                     if self.memory_usage:
                         progress.set_postfix(self.get_postfix(len(futures)))
-                    future_to_frame[future] = frame_index  # Keep track of which frame the future corresponds to
+                    future_to_frame[future] = (frame_index, filename)  # Keep track of which frame the future corresponds to
                     if get_mem_usage('vms', 'g') >= self.max_memory:
-                        futures[:1][0].result()
+                        drain_to = max(min(low_watermark, len(futures) - 1), 0)  # at least one pending write has to be finished
                         self._statistics['limits_reaches'] += 1
+                    elif len(futures) >= high_watermark:
+                        drain_to = low_watermark
+                        self._statistics['backpressure_events'] += 1
+                    else:
+                        continue
+                    while len(futures) > drain_to:
+                        wait(futures.copy(), return_when=FIRST_COMPLETED)  # errors are reported below
 
+                frames_paths: List[NumeratedFramePath] = []
                 for future in as_completed(future_to_frame):
-                    frame_index = future_to_frame[future]
+                    frame_index, filename = future_to_frame[future]
                     try:
                         if not future.result():
                             raise Exception(f"Error writing frame {frame_index}")
+                        frames_paths.append((frame_index, filename))
                     except Exception as exc:
                         print(f'Frame {frame_index} generated an exception: {exc}')
 
-                capture.release()
+        frames_paths.sort()  # the written files are already known, so the directory isn't scanned again
+        return frames_paths
 
-        frames_path = sorted(glob.glob(os.path.join(glob.escape(path), f'*{self._writer.extension}')))
-        return [(int(get_file_name(file_path)), file_path) for file_path in frames_path if is_file(file_path)]
+    def _read_frames(self, start: int, stop: int) -> Iterator[Tuple[int, Frame]]:
+        """
+        Yields (frame_index, frame) pairs of the [start, stop] range, reading the video sequentially
+        """
+        capture = self.open()
+        try:
+            capture.set(cv2.CAP_PROP_POS_FRAMES, start)
+            for frame_index in range(start, stop + 1):  # increase stop as it required by range() logic
+                frame: Frame
+                ret, frame = capture.read()
+                if not ret:
+                    break
+                yield frame_index, frame
+        finally:
+            capture.release()
 
     def get_mem_usage(self) -> str:
         mem_rss = get_mem_usage()
@@ -144,28 +210,39 @@ class CV2VideoHandler(BaseFrameHandler):
             self._statistics['mem_rss_max'] = mem_rss
         if self._statistics['mem_vms_max'] < mem_vms:
             self._statistics['mem_vms_max'] = mem_vms
-        return '{:.2f}'.format(mem_rss).zfill(5) + 'MB [MAX:{:.2f}'.format(self._statistics['mem_rss_max']).zfill(5) + 'MB]' + '/' + '{:.2f}'.format(mem_vms).zfill(5) + 'MB [MAX:{:.2f}'.format(
-            self._statistics['mem_vms_max']).zfill(5) + 'MB]'
+        return f"{mem_rss:05.2f}MB [MAX:{self._statistics['mem_rss_max']:.2f}MB]/{mem_vms:05.2f}MB [MAX:{self._statistics['mem_vms_max']:.2f}MB]"
 
     def get_postfix(self, futures_length: int) -> dict[str, Any]:
+        if self._memory_usage_sample is None or 0 == self._postfix_calls % self.MEMORY_SAMPLE_INTERVAL:
+            self._memory_usage_sample = self.get_mem_usage()
+        self._postfix_calls += 1
         postfix = {
-            'memory_usage': self.get_mem_usage(),
+            'memory_usage': self._memory_usage_sample,
             'futures': futures_length,
         }
         if self._statistics['limits_reaches'] > 0:
             postfix['limit_reaches'] = self._statistics['limits_reaches']
+        if self._statistics['backpressure_events'] > 0:
+            postfix['backpressure_events'] = self._statistics['backpressure_events']
         return postfix
 
     def extract_frame(self, frame_number: int) -> NumberedFrame:
         if frame_number > self.fc:
             raise EOutOfRange(frame_number, 0, self.fc)
-        capture = self.open()
-        capture.set(cv2.CAP_PROP_POS_FRAMES, frame_number - 1)  # zero-based frames
-        # Note: we can get a message like
-        # [mov,mp4,m4a,3gp,3g2,mj2 @ 000001cb3b65c780] stream 1, offset 0x20e8c99: partial file
-        # here, but can't do anything with it (because it is from ffmpeg backend). It means that the file is broken.
-        ret, frame = capture.read()
-        capture.release()
+        with self._capture_lock:
+            capture = self._shared_capture()
+            frame_index = frame_number - 1  # zero-based frames
+            skip = frame_index - self._last_decoded_index - 1 if self._last_decoded_index is not None else -1
+            if 0 <= skip <= self.SEEK_THRESHOLD:  # a short forward step is cheaper to decode than to seek with a keyframe resync
+                for _ in range(skip):
+                    capture.grab()
+            else:
+                capture.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+            # Note: we can get a message like
+            # [mov,mp4,m4a,3gp,3g2,mj2 @ 000001cb3b65c780] stream 1, offset 0x20e8c99: partial file
+            # here, but can't do anything with it (because it is from ffmpeg backend). It means that the file is broken.
+            ret, frame = capture.read()
+            self._last_decoded_index = frame_index if ret else None
         if not ret:
             raise Exception(f"Error reading frame {frame_number}")
         return NumberedFrame(frame_number, frame)
@@ -176,13 +253,12 @@ class CV2VideoHandler(BaseFrameHandler):
             app_logger.info('Sound copying is not supported in CV2VideoHandler')
         try:
             Path(os.path.dirname(filename)).mkdir(parents=True, exist_ok=True)
-            frame_files = glob.glob(os.path.join(glob.escape(from_dir), f'*{self._writer.extension}'))
+            frame_files = sorted(glob.glob(os.path.join(glob.escape(from_dir), f'*{self._writer.extension}')))
             first_frame = read_from_image(frame_files[0])
             height, width, channels = first_frame.shape
             fourcc = self.suggest_codec()
             video_writer = cv2.VideoWriter(filename, fourcc, self.output_fps, (width, height))
-            for frame_path in frame_files:
-                frame = read_from_image(frame_path)
+            for frame in self._read_images_ahead(frame_files):
                 video_writer.write(frame)
             video_writer.release()
             return True
@@ -190,6 +266,22 @@ class CV2VideoHandler(BaseFrameHandler):
             app_logger.exception(exception)
             return False
 
+    @staticmethod
+    def _read_images_ahead(paths: List[str]) -> Iterator[Frame]:
+        """
+        Yields images in the order of paths, decoding the next ones in a thread pool while the current one is consumed.
+        The number of images decoded ahead is limited, so memory usage doesn't depend on the frames count
+        """
+        workers = psutil.cpu_count()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: deque[Future[Frame]] = deque(executor.submit(read_from_image, path) for path in paths[:workers * 2])
+            for path in paths[workers * 2:]:
+                frame = pending.popleft().result()
+                pending.append(executor.submit(read_from_image, path))
+                yield frame
+            while pending:
+                yield pending.popleft().result()
+
     def suggest_codec(self) -> int:
         codecs_strings = ["H264", "X264", "DIVX", "XVID", "MJPG", "WMV1", "WMV2", "FMP4", "mp4v", "avc1", "I420", "IYUV", "mpg1", ]
         for codec in codecs_strings:
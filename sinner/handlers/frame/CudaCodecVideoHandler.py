@@ -0,0 +1,60 @@
+from argparse import Namespace
+from functools import cache
+from typing import Iterator, Tuple, Any
+
+import cv2
+
+from sinner.handlers.frame.CV2VideoHandler import CV2VideoHandler
+from sinner.typing import Frame
+from sinner.validators.AttributeLoader import Rules
+
+
+class CudaCodecVideoHandler(CV2VideoHandler):
+    """
+    The video processing module, which decodes frames with NVDEC through the OpenCV cudacodec module.
+    The hardware reader supports only forward sequential reading, so it's used for frames extraction,
+    while single frames extraction, metadata and the resulting video are handled as in CV2VideoHandler.
+    """
+
+    def rules(self) -> Rules:
+        return [
+            {
+                'module_help': 'The video processing module, based on CV2 library with NVIDIA hardware decoding'
+            }
+        ]
+
+    @staticmethod
+    @cache  # the devices count is requested once per process
+    def available() -> bool:
+        return hasattr(cv2, 'cudacodec') and cv2.cuda.getCudaEnabledDeviceCount() > 0
+
+    def __init__(self, target_path: str, parameters: Namespace):
+        if not self.available():
+            raise Exception('CUDA video decoding is not available. Use OpenCV built with cudacodec or use --frame-handler=cv2')
+        super().__init__(target_path, parameters)
+
+    @staticmethod
+    def _create_reader(path: str) -> Any:
+        """
+        Creates the hardware reader. Raises cv2.error, if NVDEC can't decode the file codec or container
+        """
+        reader = cv2.cudacodec.createVideoReader(path)  # type: ignore[attr-defined]
+        reader.set(cv2.cudacodec.ColorFormat_BGR)  # type: ignore[attr-defined]
+        return reader
+
+    def _read_frames(self, start: int, stop: int) -> Iterator[Tuple[int, Frame]]:
+        return CudaCodecVideoHandler._read_reader_frames(CudaCodecVideoHandler._create_reader(self._target_path), start, stop)
+
+    @staticmethod
+    def _read_reader_frames(reader: Any, start: int, stop: int) -> Iterator[Tuple[int, Frame]]:
+        """
+        Decodes frames sequentially on the GPU, skipping the frames before start without downloading them
+        """
+        for _ in range(start):
+            if not reader.grab():
+                return
+        for frame_index in range(start, stop + 1):
+            ret, gpu_frame = reader.nextFrame()
+            if not ret:
+                break
+            yield frame_index, gpu_frame.download()
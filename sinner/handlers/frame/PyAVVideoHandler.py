@@ -0,0 +1,168 @@
+from argparse import Namespace
+from fractions import Fraction
+from typing import Iterator, Tuple, Optional
+
+from sinner.handlers.frame.CV2VideoHandler import CV2VideoHandler
+from sinner.handlers.frame.EOutOfRange import EOutOfRange
+from sinner.models.NumberedFrame import NumberedFrame
+from sinner.typing import Frame
+from sinner.validators.AttributeLoader import Rules
+
+try:
+    import av
+    from av.container import InputContainer
+    from av.video.frame import VideoFrame
+    from av.video.stream import VideoStream
+except ImportError:  # PyAV is an optional dependency
+    av = None  # type: ignore[assignment]
+
+
+class PyAVVideoHandler(CV2VideoHandler):
+    """
+    The video processing module, based on PyAV (libav bindings).
+    Seeks to the nearest keyframe and decodes forward instead of resyncing the decoder on every frame position change.
+    Writes the resulting video the same way, as CV2VideoHandler does.
+    """
+
+    _container: Optional['InputContainer'] = None  # kept open between frame extractions
+    _stream: Optional['VideoStream'] = None  # the video stream of the shared container
+    _decoder: Optional[Iterator['VideoFrame']] = None  # the decoding position of the shared container
+
+    def rules(self) -> Rules:
+        return [
+            {
+                'module_help': 'The video processing module, based on PyAV library'
+            }
+        ]
+
+    @staticmethod
+    def available() -> bool:
+        return av is not None
+
+    def __init__(self, target_path: str, parameters: Namespace):
+        if not self.available():
+            raise Exception('PyAV is not installed. Install it or use --frame-handler=cv2')
+        super().__init__(target_path, parameters)
+
+    def open(self) -> 'InputContainer':  # type: ignore[override]
+        return PyAVVideoHandler._open_container(self._target_path)
+
+    @staticmethod
+    def _open_container(path: str) -> 'InputContainer':
+        try:
+            return av.open(path)
+        except av.FFmpegError as exception:
+            raise Exception("Error opening frame file") from exception
+
+    @staticmethod
+    def _video_stream(container: 'InputContainer') -> 'VideoStream':
+        stream = container.streams.video[0]
+        stream.thread_type = 'AUTO'  # frame and slice threading in the decoder
+        return stream
+
+    @staticmethod
+    def _stream_fps(stream: 'VideoStream') -> Fraction:
+        return stream.average_rate or stream.guessed_rate or Fraction(0)
+
+    @staticmethod
+    def _stream_time_base(stream: 'VideoStream') -> Fraction:
+        return stream.time_base or Fraction(1, av.time_base)
+
+    @staticmethod
+    def _frame_index(pts: int, stream: 'VideoStream', fps: Fraction) -> int:
+        return round((pts - (stream.start_time or 0)) * PyAVVideoHandler._stream_time_base(stream) * fps)
+
+    @staticmethod
+    def _frame_pts(frame_index: int, stream: 'VideoStream', fps: Fraction) -> int:
+        return int(frame_index / fps / PyAVVideoHandler._stream_time_base(stream)) + (stream.start_time or 0)
+
+    def _read_metadata(self) -> Tuple[float, int, tuple[int, int]]:
+        with PyAVVideoHandler._open_container(self._target_path) as container:
+            stream = container.streams.video[0]
+            fps = PyAVVideoHandler._stream_fps(stream)
+            fc = stream.frames  # the value from the container header, zero if it is not stored
+            if 0 == fc and stream.duration is not None:
+                fc = int(stream.duration * PyAVVideoHandler._stream_time_base(stream) * fps)
+            return float(fps), fc, (stream.width, stream.height)
+
+    def _read_frames(self, start: int, stop: int) -> Iterator[Tuple[int, Frame]]:
+        return PyAVVideoHandler._read_container_frames(self._target_path, start, stop)
+
+    @staticmethod
+    def _read_container_frames(path: str, start: int, stop: int) -> Iterator[Tuple[int, Frame]]:
+        """
+        Seeks once to the keyframe before start, then demuxes and decodes sequentially up to stop
+        """
+        if start > stop:
+            return
+        with PyAVVideoHandler._open_container(path) as container:
+            stream = PyAVVideoHandler._video_stream(container)
+            fps = PyAVVideoHandler._stream_fps(stream)
+            if start > 0:
+                container.seek(PyAVVideoHandler._frame_pts(start, stream, fps), any_frame=False, backward=True, stream=stream)
+            for frame in container.decode(stream):
+                if frame.pts is None:
+                    continue
+                frame_index = PyAVVideoHandler._frame_index(frame.pts, stream, fps)
+                if frame_index < start:
+                    continue  # frames between the keyframe and the start
+                if frame_index > stop:
+                    break
+                yield frame_index, frame.to_ndarray(format='bgr24')
+
+    def _shared_container(self) -> Tuple['InputContainer', 'VideoStream']:
+        """
+        Returns the container with its video stream, which are kept open between frame extractions.
+        Must be called with the _capture_lock acquired
+        """
+        if self._container is None or self._stream is None:
+            self._container = self.open()
+            self._stream = PyAVVideoHandler._video_stream(self._container)
+            self._decoder = None
+            self._last_decoded_index = None
+        return self._container, self._stream
+
+    def close(self) -> None:
+        """
+        Releases the shared container, it will be reopened on the next request
+        """
+        super().close()
+        with self._capture_lock:
+            if self._container is not None:
+                self._container.close()
+                self._container = None
+                self._stream = None
+                self._decoder = None
+                self._last_decoded_index = None
+
+    def __del__(self) -> None:
+        super().__del__()
+        if self._container is not None:
+            self._container.close()
+
+    def extract_frame(self, frame_number: int, exact: bool = True) -> NumberedFrame:
+        """
+        :param frame_number: the frame number (one-based, as in CV2VideoHandler)
+        :param exact: if False, returns the keyframe before the requested frame, skipping the decoding
+        of intermediate frames. It's faster, but the frame can differ from the requested one
+        """
+        if frame_number > self.fc:
+            raise EOutOfRange(frame_number, 0, self.fc)
+        frame_index = max(frame_number - 1, 0)  # zero-based frames
+        with self._capture_lock:
+            container, stream = self._shared_container()
+            fps = PyAVVideoHandler._stream_fps(stream)
+            skip = frame_index - self._last_decoded_index - 1 if self._last_decoded_index is not None else -1
+            if self._decoder is None or not 0 <= skip <= self.SEEK_THRESHOLD:  # a short forward step is cheaper to decode than to seek
+                container.seek(PyAVVideoHandler._frame_pts(frame_index, stream, fps), any_frame=False, backward=True, stream=stream)
+                self._decoder = container.decode(stream)
+            for frame in self._decoder:
+                if frame.pts is None:
+                    continue
+                decoded_index = PyAVVideoHandler._frame_index(frame.pts, stream, fps)
+                if not exact or decoded_index >= frame_index:
+                    self._last_decoded_index = decoded_index
+                    return NumberedFrame(frame_number, frame.to_ndarray(format='bgr24'))
+            self._decoder = None  # the stream is over, the next request will seek
+            self._last_decoded_index = None
+        raise Exception(f"Error reading frame {frame_number}")
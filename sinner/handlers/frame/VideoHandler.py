@@ -1,10 +1,19 @@
+from typing import Iterator, Tuple
+
+import cv2
+
+from sinner.AppLogger import app_logger
 from sinner.handlers.frame.CV2VideoHandler import CV2VideoHandler
+from sinner.handlers.frame.CudaCodecVideoHandler import CudaCodecVideoHandler
 from sinner.handlers.frame.FFMpegVideoHandler import FFMpegVideoHandler
+from sinner.handlers.frame.PyAVVideoHandler import PyAVVideoHandler
+from sinner.typing import Frame
 from sinner.validators.AttributeLoader import Rules
 
 
 class VideoHandler(CV2VideoHandler, FFMpegVideoHandler):
     keep_audio: bool
+    hardware_decoding: bool
 
     fps: float
     fc: int
@@ -18,11 +27,30 @@ class VideoHandler(CV2VideoHandler, FFMpegVideoHandler):
                 'default': False,
                 'help': 'Keep original audio'
             },
+            {
+                'parameter': 'hardware-decoding',
+                'default': True,
+                'help': 'Extract frames with NVDEC, if OpenCV is built with cudacodec'
+            },
             {
                 'module_help': 'The combined video processing module'
             }
         ]
 
+    def _read_frames(self, start: int, stop: int) -> Iterator[Tuple[int, Frame]]:
+        if self.hardware_decoding and CudaCodecVideoHandler.available():
+            try:
+                reader = CudaCodecVideoHandler._create_reader(self._target_path)  # created here, so a failure can fall back to the next backend
+                app_logger.info(f"Decoding {self._target_path} with CudaCodecVideoHandler")
+                return CudaCodecVideoHandler._read_reader_frames(reader, start, stop)
+            except cv2.error as exception:
+                app_logger.warning(f"NVDEC can't decode {self._target_path}, falling back to software decoding: {exception}")
+        if PyAVVideoHandler.available():
+            app_logger.info(f"Decoding {self._target_path} with PyAVVideoHandler")
+            return PyAVVideoHandler._read_container_frames(self._target_path, start, stop)
+        app_logger.info(f"Decoding {self._target_path} with CV2VideoHandler")
+        return super()._read_frames(start, stop)
+
     def result(self, from_dir: str, filename: str, audio_target: str | None = None) -> bool:
         if FFMpegVideoHandler.available():
             return FFMpegVideoHandler.result(self, from_dir, filename, audio_target)
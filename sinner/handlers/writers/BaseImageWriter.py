@@ -1,7 +1,7 @@
 import os
+import threading
 from abc import ABC, abstractmethod
-from pathlib import Path
-from typing import TypeVar, Optional, Type
+from typing import TypeVar, Optional, Type, Set
 
 import cv2
 from psutil import WINDOWS
@@ -20,15 +20,30 @@ class BaseImageWriter(ABC, metaclass=SingletonABCMeta):
     # Mime-тип файла
     mime_type: str = ""
 
+    # Директории, созданные при записи (общие для всех writer'ов)
+    _created_dirs: Set[str] = set()
+    _created_dirs_lock: threading.Lock = threading.Lock()
+
     def write(self, image: Frame, path: str) -> bool:
         """Запись изображения в файл"""
-        # Создание директорий, если они не существуют
-        Path(os.path.dirname(path)).mkdir(parents=True, exist_ok=True)  # todo: can be replaced with os.makedirs
-
         # Проверка, что расширение файла соответствует формату
         if not path.lower().endswith(self.extension):
             path = f"{path}{self.extension}"
 
+        directory = os.path.dirname(path)
+        if directory not in self._created_dirs:  # директории создаются при первой записи в них, а не перед каждым кадром
+            self._make_dir(directory)
+            return self._write(image, path)
+        try:
+            if self._write(image, path):
+                return True
+        except OSError:
+            pass
+        # Директория могла быть удалена после создания: создаём её заново и повторяем запись
+        self._make_dir(directory)
+        return self._write(image, path)
+
+    def _write(self, image: Frame, path: str) -> bool:
         if WINDOWS:
             is_success, im_buf_arr = cv2.imencode(self.extension, image, self._get_write_params())
             im_buf_arr.tofile(path)
@@ -36,6 +51,12 @@ class BaseImageWriter(ABC, metaclass=SingletonABCMeta):
         else:
             return cv2.imwrite(path, image, self._get_write_params())
 
+    def _make_dir(self, directory: str) -> None:
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._created_dirs_lock:
+            self._created_dirs.add(directory)
+
     @abstractmethod
     def _get_write_params(self) -> list[int]:
         pass
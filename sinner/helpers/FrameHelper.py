@@ -1,7 +1,7 @@
 # helper methods to work with frames entity
 
 import cv2
-from numpy import fromfile, uint8, full, dstack
+from numpy import fromfile, uint8, full
 from psutil import WINDOWS
 
 from sinner.typing import Frame
@@ -18,9 +18,9 @@ def read_from_image(path: str) -> Frame:
     if WINDOWS:  # issue #511
         image = cv2.imdecode(fromfile(path, dtype=uint8), cv2.IMREAD_UNCHANGED)
         if len(image.shape) == 2:  # fixes the b/w images issue
-            image = dstack([image] * 3)
-        if image.shape[2] == 4:  # fixes the alpha-channel issue
-            image = image[:, :, :3]
+            image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)  # type: ignore[arg-type]
+        elif image.shape[2] == 4:  # fixes the alpha-channel issue
+            image = cv2.cvtColor(image, cv2.COLOR_BGRA2BGR)  # type: ignore[arg-type]
         return image
     else:
         return cv2.imread(path)
@@ -34,26 +34,34 @@ def scale(frame: Frame, scale_: float = 0.2) -> Frame:
     return cv2.resize(frame, (int(current_width * scale_), int(current_height * scale_)))
 
 
-def resize_proportionally(frame: Frame, new_shape: tuple[int, int]) -> Frame:
+def proportional_shape(shape: tuple[int, ...], new_shape: tuple[int, int]) -> tuple[int, int]:
     """
-    Proportionally resizes frame to the requested shape
-    :param frame: the initial frame
+    Calculates the shape, that proportionally fits the requested bounds
+    :param shape: the initial shape, HEIGHT, WIDTH order
     :param new_shape: tuple[HEIGHT, WIDTH] new shape bounds
-    :return: resized shape
+    :return: tuple[HEIGHT, WIDTH] fitted shape
     """
-    original_height, original_width, _ = frame.shape
+    original_height, original_width = shape[:2]
     new_height, new_width = new_shape
     # Calculate the scaling factors for height and width
-    scale_height = new_height / original_height
-    scale_width = new_width / original_width
-    scale_ = min(scale_height, scale_width)
+    scale_ = min(new_height / original_height, new_width / original_width)
     if scale_ == 1:
+        return original_height, original_width
+    return max(int(original_height * scale_), 1), max(int(original_width * scale_), 1)
+
+
+def resize_proportionally(frame: Frame, new_shape: tuple[int, int], interpolation: int = cv2.INTER_LINEAR) -> Frame:
+    """
+    Proportionally resizes frame to the requested shape
+    :param frame: the initial frame
+    :param new_shape: tuple[HEIGHT, WIDTH] new shape bounds
+    :param interpolation: cv2 interpolation flag. The linear one is the fastest, cv2.INTER_AREA is a few times slower,
+    but gives a cleaner result for a one-off shrinking
+    :return: resized shape
+    """
+    original_height, original_width = frame.shape[:2]
+    new_height, new_width = proportional_shape(frame.shape, new_shape)
+    if (new_height, new_width) == (original_height, original_width):
         return frame
-    new_height = int(original_height * scale_)
-    if new_height == 0:
-        new_height = 1
-    new_width = int(original_width * scale_)
-    if new_width == 0:
-        new_width = 1
     # note: cv2.resize uses WIDTH, HEIGHT order, instead of frames HEIGHT, WIDTH order
-    return cv2.resize(frame, (new_width, new_height))
+    return cv2.resize(frame, (new_width, new_height), interpolation=interpolation)
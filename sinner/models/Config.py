@@ -1,9 +1,14 @@
+import os
+import sys
 from argparse import Namespace
 from configparser import ConfigParser
-from typing import Any
+from typing import Any, Dict, Tuple
 
 from sinner.utilities import get_app_dir
 
+# Разобранные ini-файлы: путь -> (время изменения, размер, разобранная конфигурация)
+_CONFIG_CACHE: Dict[str, Tuple[int, int, ConfigParser]] = {}
+
 
 class Config:
     _filename: str
@@ -13,13 +18,29 @@ class Config:
         self._filename = parameters.ini if (parameters is not None and hasattr(parameters, 'ini')) else get_app_dir('sinner.ini')
         self._config = ConfigParser()
 
+    def _read(self) -> ConfigParser:
+        """
+        Returns the parsed configuration file, parsing it again only if the file was changed since the last read
+        """
+        try:
+            stat = os.stat(self._filename)
+        except OSError:
+            return self._config
+        cached = _CONFIG_CACHE.get(self._filename)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        config = ConfigParser()
+        config.read(self._filename)
+        _CONFIG_CACHE[self._filename] = (stat.st_mtime_ns, stat.st_size, config)
+        return config
+
     def read_section(self, section: str) -> Namespace | None:
         module_parameters: Namespace = Namespace()
-        self._config.read(self._filename)
-        if self._config.has_section(section):
-            for key in self._config[section]:
-                value = self._config[section][key]
-                key = key.replace('-', '_')
+        config = self._read()
+        if config.has_section(section):
+            for key in config[section]:
+                value = config[section][key]
+                key = sys.intern(key.replace('-', '_'))
                 module_parameters.__setattr__(key, value)
             return module_parameters
         return None
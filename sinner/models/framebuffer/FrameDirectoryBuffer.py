@@ -1,13 +1,15 @@
 import os
 import threading
+from bisect import bisect_left, insort
 from pathlib import Path
-from typing import List, Optional, ClassVar, Self
+from array import array
+from typing import List, Optional, ClassVar, Self, Set, Iterable
 
 from sinner.handlers.writers.BaseImageWriter import BaseImageWriter
 from sinner.helpers.FrameHelper import read_from_image
 from sinner.models.NumberedFrame import NumberedFrame
 from sinner.models.framebuffer.FrameBufferInterface import FrameBufferInterface
-from sinner.utilities import is_absolute_path, path_exists, get_file_name, normalize_path
+from sinner.utilities import is_absolute_path, path_exists, normalize_path
 
 
 class FrameDirectoryBuffer(FrameBufferInterface):
@@ -18,8 +20,10 @@ class FrameDirectoryBuffer(FrameBufferInterface):
     _target_name: Optional[str] = None
     _frames_count: int = 0
     _zfill_length: Optional[int] = None
+    _name_format: Optional[str] = None  # format string of the frame file name, depends on frames count and writer extension
     _path: Optional[str] = None
-    _indices: List[int] = []
+    _indices_set: Set[int]  # stored indices for O(1) membership checks
+    _sorted_indices: 'array[int]'  # the same indices in ascending order, unboxed, for ordered listing and the previous frame lookup
     _indices_lock: threading.RLock
     _writer: BaseImageWriter
 
@@ -29,6 +33,7 @@ class FrameDirectoryBuffer(FrameBufferInterface):
         self.temp_dir = temp_dir
         self._writer = writer if writer else BaseImageWriter.create()
         self._indices_lock = threading.RLock()  # RLock позволяет повторно получать блокировку тем же потоком
+        self._indices = []
 
     def load(self, source_name: str, target_name: str, frames_count: int) -> Self:
         self._path = None
@@ -36,6 +41,7 @@ class FrameDirectoryBuffer(FrameBufferInterface):
         self._source_name = source_name
         self._target_name = target_name
         self._frames_count = frames_count
+        self._name_format = f'{{:0{self.zfill_length}d}}{self._writer.extension}'
         self.init_indices()
         self._loaded = True
         return self
@@ -44,12 +50,24 @@ class FrameDirectoryBuffer(FrameBufferInterface):
         with self._indices_lock:
             self._path = None
             self._zfill_length = None
+            self._name_format = None
             self._source_name = None
             self._target_name = None
             self._frames_count = 0
             self._indices = []
             self._loaded = False
 
+    @property
+    def _indices(self) -> List[int]:
+        with self._indices_lock:
+            return self._sorted_indices.tolist()
+
+    @_indices.setter
+    def _indices(self, value: List[int]) -> None:
+        with self._indices_lock:
+            self._indices_set = set(value)
+            self._sorted_indices = array('q', sorted(self._indices_set))
+
     @property
     def temp_dir(self) -> str:
         return self._temp_dir
@@ -66,6 +84,12 @@ class FrameDirectoryBuffer(FrameBufferInterface):
             self._zfill_length = len(str(self._frames_count))
         return self._zfill_length
 
+    @property
+    def name_format(self) -> str:
+        if self._name_format is None:
+            self._name_format = f'{{:0{self.zfill_length}d}}{self._writer.extension}'
+        return self._name_format
+
     @staticmethod
     def make_path(path: str) -> str:
         if not path_exists(path):
@@ -83,10 +107,12 @@ class FrameDirectoryBuffer(FrameBufferInterface):
     #  Returns a processed file name for an unprocessed frame index
     def get_frame_processed_name(self, frame: NumberedFrame) -> str:
         if frame.name:
-            filename = frame.name + self._writer.extension
-        else:
-            filename = str(frame.index).zfill(self.zfill_length) + self._writer.extension
-        return str(os.path.join(self.path, filename))
+            return os.path.join(self.path, frame.name + self._writer.extension)
+        return self.get_frame_path(frame.index)
+
+    #  Returns a processed file path for a frame index
+    def get_frame_path(self, index: int) -> str:
+        return os.path.join(self.path, self.name_format.format(index))
 
     def clean(self) -> None:
         pass
@@ -97,52 +123,68 @@ class FrameDirectoryBuffer(FrameBufferInterface):
             if not self._loaded:
                 return
                 # raise Exception(f"{self.__class__.__name__} isn't in loaded state. Call load() method properly first!")
+            path = self.path
+            frame_path = self.get_frame_processed_name(frame)
 
-            if not self._writer.write(frame.frame, self.get_frame_processed_name(frame)):
-                raise Exception(f"Error saving frame: {self.get_frame_processed_name(frame)}")
-            self._indices.append(frame.index)
+        # the frame is encoded and written without holding the lock, so has_index() and get_frame() calls from other threads aren't blocked
+        if not self._writer.write(frame.frame, frame_path):
+            raise Exception(f"Error saving frame: {frame_path}")
+        with self._indices_lock:
+            if self._loaded and self._path == path:  # the buffer could be flushed or reloaded while writing
+                self.add_index(frame.index)
 
     def get_frame(self, index: int, return_previous: bool = True) -> Optional[NumberedFrame]:
         if not self._loaded:  # not loaded
             return None
         if self.has_index(index):
-            filename = str(index).zfill(self.zfill_length) + self._writer.extension
-            filepath = str(os.path.join(self.path, filename))
+            filepath = self.get_frame_path(index)
             try:
                 self._miss = 0
                 return NumberedFrame(index, read_from_image(filepath))
             except Exception:
                 pass  # Файл может быть заблокирован или поврежден
         elif return_previous:
-            for previous_number in range(index - 1, 0, -1):
-                if self.has_index(previous_number):
-                    previous_filename = str(previous_number).zfill(self.zfill_length) + self._writer.extension
-                    previous_file_path = os.path.join(self.path, previous_filename)
-                    if path_exists(previous_file_path):
-                        try:
-                            self._miss = index - previous_number
-                            return NumberedFrame(previous_number, read_from_image(previous_file_path))
-                        except Exception:  # the file may exist but can be locked in another thread.
-                            pass
+            previous_number = self.get_previous_index(index)
+            while previous_number is not None and previous_number > 0:
+                previous_file_path = self.get_frame_path(previous_number)
+                if path_exists(previous_file_path):
+                    try:
+                        self._miss = index - previous_number
+                        return NumberedFrame(previous_number, read_from_image(previous_file_path))
+                    except Exception:  # the file may exist but can be locked in another thread.
+                        pass
+                previous_number = self.get_previous_index(previous_number)
         return None
 
     def has_index(self, index: int) -> bool:
         with self._indices_lock:
-            return index in self._indices
+            return index in self._indices_set
+
+    def has_indices(self, indices: Iterable[int]) -> List[bool]:
+        """Checks a batch of indices with one lock acquisition"""
+        with self._indices_lock:
+            return [index in self._indices_set for index in indices]
+
+    def get_previous_index(self, index: int) -> Optional[int]:
+        """Returns the biggest stored index below the given one, or None"""
+        with self._indices_lock:
+            position = bisect_left(self._sorted_indices, index)
+            return self._sorted_indices[position - 1] if position > 0 else None
 
     def init_indices(self) -> None:
+        extension = self._writer.extension
+        extension_length = len(extension)
         with self._indices_lock:
-            self._indices = []
             with os.scandir(self.path) as entries:
-                for entry in entries:
-                    if entry.is_file() and entry.name.endswith(self._writer.extension):
-                        self._indices.append(int(get_file_name(entry.name)))
+                # frame files are named by their index, so the name without the extension is parsed directly
+                self._indices = [int(entry.name[:-extension_length]) for entry in entries if entry.name.endswith(extension) and entry.is_file()]
 
     def get_indices(self) -> List[int]:
-        with self._indices_lock:
-            return self._indices.copy()  # prevents change of internal list from outside
+        return self._indices  # a new list on every call, so the internal storage can't be changed from outside
 
     def add_index(self, index: int) -> None:
         """Adds index internally. Introduced for remote processing"""
         with self._indices_lock:
-            self._indices.append(index)
+            if index not in self._indices_set:
+                self._indices_set.add(index)
+                insort(self._sorted_indices, index)
@@ -1,6 +1,7 @@
 import threading
+from bisect import bisect_left
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, Self, Optional, Any
+from typing import Dict, Self, Optional, Any, List, Iterable
 
 import psutil
 
@@ -28,10 +29,11 @@ class FrameMemoryBuffer(FrameDirectoryBuffer):
         super().__init__(temp_dir, writer)
         self._buffer_size: int = buffer_size
         self._memory_buffer: Dict[int, NumberedFrame] = {}
-        self._buffer_lock: threading.RLock = threading.RLock()
+        self._memory_indices: List[int] = []  # sorted keys of _memory_buffer, to find earlier frames by bisection
+        self._buffer_lock: threading.Lock = threading.Lock()  # not reentrant: no method re-enters it while holding it
         self._current_buffer_size: int = 0
         self._frame_sizes: Dict[int, int] = {}
-        self._disk_write_executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=psutil.cpu_count())
+        self._disk_write_executor: Optional[ThreadPoolExecutor] = None  # created on the first asynchronous write
         self._remove_earlier_frames: bool = remove_earlier_frames  # Default strategy for removing earlier frames
 
     def load(self, source_name: str, target_name: str, frames_count: int) -> Self:
@@ -40,6 +42,7 @@ class FrameMemoryBuffer(FrameDirectoryBuffer):
             with self._buffer_lock:
                 # Clear memory buffer before loading new data
                 self._memory_buffer.clear()
+                self._memory_indices.clear()
                 self._frame_sizes.clear()
                 self._current_buffer_size = 0
 
@@ -53,18 +56,27 @@ class FrameMemoryBuffer(FrameDirectoryBuffer):
         if self._buffer_size > 0:
             frame_size = frame.frame.nbytes  # Calculate frame size in bytes
             with self._buffer_lock:
-                if self._current_buffer_size + frame_size > self._buffer_size:
-                    # Буфер заполнен, сразу записываем на диск без сохранения в памяти
-                    app_logger.info(f"Memory buffer full ({self._current_buffer_size}/{self._buffer_size} bytes), frame {frame.index} stored directly to disk")
-                    self._save_frame_to_disk(frame)
-                    return
-
-                # Add frame to memory buffer
-                self._memory_buffer[frame.index] = frame
-                self._frame_sizes[frame.index] = frame_size
-                self._current_buffer_size += frame_size
-
-            self._disk_write_executor.submit(self._save_frame_to_disk, frame)  # Асинхронно сохраняем на диск
+                previous_size = self._frame_sizes.get(frame.index, 0) if frame.index in self._memory_buffer else 0  # a replaced frame frees its size
+                buffer_full = self._current_buffer_size - previous_size + frame_size > self._buffer_size
+                if not buffer_full:
+                    # Add frame to memory buffer
+                    position = bisect_left(self._memory_indices, frame.index)
+                    if position == len(self._memory_indices) or self._memory_indices[position] != frame.index:
+                        self._memory_indices.insert(position, frame.index)
+                    self._memory_buffer[frame.index] = frame
+                    self._frame_sizes[frame.index] = frame_size
+                    self._current_buffer_size += frame_size - previous_size
+                    if self._disk_write_executor is None:
+                        self._disk_write_executor = ThreadPoolExecutor(max_workers=psutil.cpu_count())
+                current_buffer_size = self._current_buffer_size
+                disk_write_executor = self._disk_write_executor
+
+            if buffer_full:
+                # Буфер заполнен, сразу записываем на диск без сохранения в памяти (запись идёт вне блокировки)
+                app_logger.info(f"Memory buffer full ({current_buffer_size}/{self._buffer_size} bytes), frame {frame.index} stored directly to disk")
+                self._save_frame_to_disk(frame)
+            elif disk_write_executor is not None:
+                disk_write_executor.submit(self._save_frame_to_disk, frame)  # Асинхронно сохраняем на диск
         else:
             self._save_frame_to_disk(frame)  # Если буфер отключён, то записываем синхронно
 
@@ -78,9 +90,7 @@ class FrameMemoryBuffer(FrameDirectoryBuffer):
                 return
 
             # Добавляем индекс в список только после успешной записи на диск
-            with self._indices_lock:
-                if frame.index not in self._indices:
-                    self._indices.append(frame.index)
+            self.add_index(frame.index)  # повторные индексы отбрасываются внутри, под одной блокировкой
 
         except Exception as e:
             app_logger.exception(f"Error saving frame {frame.index} to disk: {e}")
@@ -106,17 +116,20 @@ class FrameMemoryBuffer(FrameDirectoryBuffer):
                     frame = self._memory_buffer.pop(index)
                     frame_size = self._frame_sizes.pop(index)
                     self._current_buffer_size -= frame_size
+                    position = bisect_left(self._memory_indices, index)  # the index itself is at this position
 
                     # If we need to remove earlier frames
                     if clear_strategy:
-                        earlier_indices = [i for i in list(self._memory_buffer.keys()) if i < index]
+                        earlier_indices = self._memory_indices[:position]
                         if earlier_indices:
                             app_logger.debug(f"Removing {len(earlier_indices)} earlier frames (indices below {index})")
 
                         for earlier_index in earlier_indices:
-                            earlier_frame_size = self._frame_sizes.pop(earlier_index)
-                            self._memory_buffer.pop(earlier_index)
-                            self._current_buffer_size -= earlier_frame_size
+                            if self._memory_buffer.pop(earlier_index, None) is not None:
+                                self._current_buffer_size -= self._frame_sizes.pop(earlier_index)
+                        del self._memory_indices[:position + 1]
+                    elif position < len(self._memory_indices) and self._memory_indices[position] == index:
+                        del self._memory_indices[position]
 
                     self._miss = 0
                     return frame
@@ -141,6 +154,13 @@ class FrameMemoryBuffer(FrameDirectoryBuffer):
         # Then check disk
         return super().has_index(index)
 
+    def has_indices(self, indices: Iterable[int]) -> List[bool]:
+        """Check a batch of indices in memory or on disk, with one acquisition of each lock."""
+        indices = list(indices)
+        with self._buffer_lock:
+            in_memory = [index in self._memory_buffer for index in indices]
+        return [memory or disk for memory, disk in zip(in_memory, super().has_indices(indices))]
+
     def flush(self) -> None:
         """Clear memory buffer and reset disk buffer."""
 
@@ -149,6 +169,7 @@ class FrameMemoryBuffer(FrameDirectoryBuffer):
         if self._buffer_size > 0:
             with self._buffer_lock:
                 self._memory_buffer.clear()
+                self._memory_indices.clear()
                 self._frame_sizes.clear()
                 self._current_buffer_size = 0
 
@@ -159,10 +180,7 @@ class FrameMemoryBuffer(FrameDirectoryBuffer):
 
         # Add indices from memory buffer
         with self._buffer_lock, self._indices_lock:
-            memory_indices = list(self._memory_buffer.keys())
-            for index in memory_indices:
-                if index not in self._indices:
-                    self._indices.append(index)
+            self._indices = [*self._sorted_indices, *self._memory_buffer.keys()]  # one bulk update, duplicates are dropped by the setter
 
     def clean(self) -> None:
         """Clean temporary files and memory buffer."""
@@ -173,6 +191,7 @@ class FrameMemoryBuffer(FrameDirectoryBuffer):
             # Clean memory buffer
             with self._buffer_lock:
                 self._memory_buffer.clear()
+                self._memory_indices.clear()
                 self._frame_sizes.clear()
                 self._current_buffer_size = 0
 
@@ -183,17 +202,20 @@ class FrameMemoryBuffer(FrameDirectoryBuffer):
         Returns:
             A dictionary with buffer statistics
         """
-        with self._buffer_lock:
-            return {
-                "frames_in_memory": len(self._memory_buffer),
-                "memory_usage_bytes": self._current_buffer_size,
-                "memory_limit_bytes": self._buffer_size,
-                "usage_percent": (self._current_buffer_size / self._buffer_size) * 100 if self._buffer_size > 0 else 0,
-                "frame_indices_in_memory": sorted(list(self._memory_buffer.keys())),
-                "remove_earlier_frames_strategy": self._remove_earlier_frames
-            }
+        with self._buffer_lock:  # only a snapshot is taken under the lock
+            indices_in_memory = list(self._memory_buffer.keys())
+            current_buffer_size = self._current_buffer_size
+        return {
+            "frames_in_memory": len(indices_in_memory),
+            "memory_usage_bytes": current_buffer_size,
+            "memory_limit_bytes": self._buffer_size,
+            "usage_percent": (current_buffer_size / self._buffer_size) * 100 if self._buffer_size > 0 else 0,
+            "frame_indices_in_memory": sorted(indices_in_memory),
+            "remove_earlier_frames_strategy": self._remove_earlier_frames
+        }
 
     def __del__(self) -> None:
         """Clean up resources when object is deleted."""
-        if hasattr(self, '_disk_write_executor'):
-            self._disk_write_executor.shutdown(wait=False)
+        disk_write_executor = getattr(self, '_disk_write_executor', None)
+        if disk_write_executor is not None:
+            disk_write_executor.shutdown(wait=False)
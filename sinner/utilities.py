@@ -8,6 +8,7 @@ import shutil
 import sys
 import urllib
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Literal, Any, get_type_hints, Callable
 
@@ -57,38 +58,70 @@ def is_dir(path: str) -> bool:
 def get_directory_file_list(directory_path: str, filter_: Callable[[str], bool] | None = None) -> List[str]:
     result: List[str] = []
     if is_dir(directory_path):
-        for root, dirs, files in os.walk(directory_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                if filter_:
-                    if filter_(file_path) is True:
-                        result.append(file_path)
-                else:
-                    result.append(file_path)
+        _scan_directory_files(directory_path, filter_, result)
     return result
 
 
+# walks the directory tree in the os.walk order, but uses the file type, cached by os.scandir, instead of a stat call per file
+def _scan_directory_files(directory_path: str, filter_: Callable[[str], bool] | None, result: List[str]) -> None:
+    subdirectories: List[str] = []
+    try:
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():  # os.walk does not follow symlinks by default
+                        subdirectories.append(entry.path)
+                elif entry.is_file() and (filter_ is None or filter_(entry.path) is True):
+                    result.append(entry.path)
+    except OSError:  # unreadable directories are skipped, as os.walk does
+        return
+    for subdirectory in subdirectories:
+        _scan_directory_files(subdirectory, filter_, result)
+
+
+# the mimetype depends only on the file extension, so it is guessed once per extension
+@lru_cache(maxsize=4096)
+def guess_extension_mimetype(extension: str) -> str | None:
+    mimetype, _ = mimetypes.guess_type(f"file{extension}")
+    return mimetype
+
+
+# checks only the path extension, use it when the path is already known to be a file (e.g. while walking a directory)
+def has_image_mimetype(image_path: str) -> bool:
+    mimetype = guess_extension_mimetype(os.path.splitext(image_path)[1])
+    return bool(mimetype and mimetype.startswith('image/'))
+
+
+# checks only the path extension, use it when the path is already known to be a file (e.g. while walking a directory)
+def has_video_mimetype(video_path: str) -> bool:
+    mimetype = guess_extension_mimetype(os.path.splitext(video_path)[1])
+    return bool(mimetype and (mimetype.startswith('frame/') or mimetype.startswith('video/')))
+
+
 def is_image(image_path: str | None) -> bool:
     if image_path is not None and image_path and is_file(image_path):
-        mimetype, _ = mimetypes.guess_type(image_path)
-        return bool(mimetype and mimetype.startswith('image/'))
+        return has_image_mimetype(image_path)
     return False
 
 
 def is_video(video_path: str | None) -> bool:
     if video_path is not None and is_file(video_path):
-        mimetype, _ = mimetypes.guess_type(video_path)
-        return bool(mimetype and (mimetype.startswith('frame/') or mimetype.startswith('video/')))
+        return has_video_mimetype(video_path)
     return False
 
 
-def get_type_extensions(mime_type: str) -> List[str]:
+@lru_cache(maxsize=None)
+def _get_type_extensions(mime_type: str) -> tuple[str, ...]:
     image_extensions: List[str] = []
     for ext in mimetypes.types_map:
         mimetype, encoding = mimetypes.guess_type(f"file.{ext}")
         if mimetype and mimetype.startswith(mime_type):
             image_extensions.append(ext)
-    return image_extensions
+    return tuple(image_extensions)
+
+
+def get_type_extensions(mime_type: str) -> List[str]:
+    return list(_get_type_extensions(mime_type))
 
 
 def normalize_path(path: Any) -> str | None:
@@ -146,6 +146,7 @@ class WebCam(AttributeLoader):
         self._camera_input = cv2.VideoCapture(self.input_device)
         if not self._camera_input.isOpened():
             raise Exception(f"Error opening camera {self.input_device}")
+        self._camera_input.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # keep only the latest frame queued, so the output doesn't lag behind the camera
         app_logger.info(f"Camera input is opened at device={self.input_device}")
         return self._camera_input
 
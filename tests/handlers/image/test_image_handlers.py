@@ -48,6 +48,18 @@ class TestBaseImageHandler:
             # Попытка создать экземпляр абстрактного класса должна вызвать ошибку
             BaseImageWriter()
 
+    def test_write_recreates_removed_directory(self, test_image_path, cleanup_tmp_dir):
+        """Проверка, что запись восстанавливает директорию, удалённую после первой записи в неё"""
+        handler = PNGWriter()
+        image = FrameHelper.read_from_image(test_image_path)
+        directory = os.path.join(tmp_dir, 'recreated')
+        assert handler.write(image, os.path.join(directory, 'test_1.png')) is True
+        assert directory in BaseImageWriter._created_dirs
+        shutil.rmtree(directory)
+        assert handler.write(image, os.path.join(directory, 'test_2.png')) is True
+        assert os.path.exists(os.path.join(directory, 'test_2.png'))
+        shutil.rmtree(directory)
+
 
 class TestJPEGHandler:
     """Тесты для обработчика JPEG изображений"""
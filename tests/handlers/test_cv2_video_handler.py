@@ -1,3 +1,4 @@
+import glob
 import os
 import shutil
 from argparse import Namespace
@@ -9,6 +10,7 @@ from numpy import ndarray
 
 from sinner.Parameters import Parameters
 from sinner.handlers.frame.CV2VideoHandler import CV2VideoHandler
+from sinner.helpers.FrameHelper import read_from_image
 from sinner.utilities import resolve_relative_path
 from tests.constants import TARGET_FPS, TARGET_FC, FRAME_SHAPE, tmp_dir, target_mp4, broken_mp4, result_mp4, state_frames_dir, TARGET_RESOLUTION, BROKEN_FC, state_frames_jpg_dir
 
@@ -170,6 +172,38 @@ def test_extract_frame(test_object):
     assert first_frame.frame.shape == FRAME_SHAPE
 
 
+def test_extract_frame_reuses_capture(test_object):
+    """Проверка повторного использования открытого захвата при извлечении кадров"""
+    test_object.extract_frame(1)
+    capture = test_object._capture
+    assert capture is not None
+    assert test_object.extract_frame(5).index == 5
+    assert test_object._capture is capture
+    test_object.close()
+    assert test_object._capture is None
+    assert test_object.extract_frame(TARGET_FC).frame.shape == FRAME_SHAPE
+
+
+def test_extract_frame_sequential(test_object, test_parameters):
+    """Последовательное извлечение кадров (без позиционирования) даёт те же кадры, что и позиционирование"""
+    for frame_number in [1, 2, 3, 5, 9, 4, 10]:
+        sequential_frame = test_object.extract_frame(frame_number)
+        seek_frame = CV2VideoHandler(parameters=test_parameters, target_path=target_mp4).extract_frame(frame_number)
+        assert sequential_frame.index == frame_number
+        assert (sequential_frame.frame == seek_frame.frame).all()
+        assert test_object._last_decoded_index == frame_number - 1
+
+
+def test_read_images_ahead():
+    """Проверка упреждающего чтения кадров: порядок и содержимое совпадают с последовательным чтением"""
+    paths = sorted(glob.glob(os.path.join(state_frames_dir, '*.png')))
+    frames = list(CV2VideoHandler._read_images_ahead(paths))
+    assert len(paths) == len(frames)
+    for frame, path in zip(frames, paths):
+        assert (frame == read_from_image(path)).all()
+    assert [] == list(CV2VideoHandler._read_images_ahead([]))
+
+
 def test_result(test_object, image_format):
     """Проверка создания результирующего видео"""
     if 'CI' in os.environ:
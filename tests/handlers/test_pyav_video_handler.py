@@ -0,0 +1,125 @@
+import os
+import shutil
+from argparse import Namespace
+
+import pytest
+from numpy import ndarray
+
+from sinner.Parameters import Parameters
+from sinner.handlers.frame.CV2VideoHandler import CV2VideoHandler
+from sinner.handlers.frame.PyAVVideoHandler import PyAVVideoHandler
+from sinner.handlers.frame.EOutOfRange import EOutOfRange
+from sinner.utilities import resolve_relative_path
+from tests.constants import TARGET_FPS, TARGET_FC, FRAME_SHAPE, tmp_dir, target_mp4, TARGET_RESOLUTION
+
+av = pytest.importorskip('av')
+
+# Базовые параметры командной строки
+base_parameters = Parameters().parameters
+
+
+def setup():
+    #  clean previous results, if exists
+    if os.path.exists(tmp_dir):
+        shutil.rmtree(tmp_dir)
+
+
+def setup_function():
+    setup()
+
+
+@pytest.fixture(params=['png', 'jpg'])
+def image_format(request):
+    """Фикстура для тестирования разных форматов изображений"""
+    return request.param
+
+
+@pytest.fixture
+def test_parameters(image_format):
+    """Фикстура для создания параметров командной строки с разными форматами"""
+    params = Namespace()
+    for key, value in vars(base_parameters).items():
+        setattr(params, key, value)
+    setattr(params, 'format', image_format)
+    return params
+
+
+@pytest.fixture
+def test_object(test_parameters):
+    """Фикстура для создания тестового объекта PyAVVideoHandler"""
+    return PyAVVideoHandler(parameters=test_parameters, target_path=target_mp4)
+
+
+def test_available(test_object):
+    """Проверка доступности обработчика"""
+    assert test_object.available() is True
+
+
+def test_open(test_object):
+    """Проверка открытия видеофайла"""
+    with test_object.open() as container:
+        assert isinstance(container, av.container.InputContainer)
+    with pytest.raises(Exception):
+        PyAVVideoHandler(parameters=base_parameters, target_path='Wrong file').open()
+
+
+def test_detect_metadata(test_object):
+    """Проверка определения FPS, количества кадров и разрешения"""
+    assert TARGET_FPS == test_object.fps
+    assert TARGET_FC == test_object.fc
+    assert TARGET_RESOLUTION == test_object.resolution
+
+
+def test_get_frames_paths(test_object, image_format):
+    """Проверка получения путей к кадрам"""
+    frames_paths = test_object.get_frames_paths(path=tmp_dir)
+    assert TARGET_FC == len(frames_paths)
+    assert (0, resolve_relative_path(os.path.join(tmp_dir, f'00.{image_format}'))) == frames_paths[0]
+    assert (9, resolve_relative_path(os.path.join(tmp_dir, f'09.{image_format}'))) == frames_paths[-1]
+
+
+def test_get_frames_paths_range(test_object, image_format):
+    """Проверка получения путей к кадрам с указанием диапазона"""
+    frames_paths = test_object.get_frames_paths(path=tmp_dir, frames_range=(3, 8))
+    assert 6 == len(frames_paths)
+    assert (3, resolve_relative_path(os.path.join(tmp_dir, f'03.{image_format}'))) == frames_paths[0]
+    assert (8, resolve_relative_path(os.path.join(tmp_dir, f'08.{image_format}'))) == frames_paths[-1]
+
+
+def test_get_frames_paths_range_fail(test_object):
+    """Проверка получения путей к кадрам с неправильным диапазоном"""
+    assert 0 == len(test_object.get_frames_paths(path=tmp_dir, frames_range=(10, 1)))
+
+
+def test_extract_frame(test_object):
+    """Проверка извлечения кадра"""
+    first_frame = test_object.extract_frame(1)
+    assert 1 == first_frame.index
+    assert isinstance(first_frame.frame, ndarray)
+    assert first_frame.frame.shape == FRAME_SHAPE
+    with pytest.raises(EOutOfRange):
+        test_object.extract_frame(TARGET_FC + 1)
+
+
+def test_extract_frame_matches_cv2(test_object, test_parameters):
+    """Кадры, извлечённые PyAV, совпадают с кадрами CV2 (с точностью до конвертации цвета)"""
+    cv2_object = CV2VideoHandler(parameters=test_parameters, target_path=target_mp4)
+    for frame_number in (1, 5, TARGET_FC):
+        pyav_frame = test_object.extract_frame(frame_number).frame.astype(int)
+        cv2_frame = cv2_object.extract_frame(frame_number).frame.astype(int)
+        assert abs(pyav_frame - cv2_frame).mean() < 5
+
+
+def test_extract_frame_sequential(test_object, test_parameters):
+    """Последовательное извлечение кадров продолжает декодирование в том же контейнере и даёт те же кадры, что и позиционирование"""
+    for frame_number in [1, 2, 3, 5, 9, 4, 10]:
+        sequential_frame = test_object.extract_frame(frame_number)
+        seek_frame = PyAVVideoHandler(parameters=test_parameters, target_path=target_mp4).extract_frame(frame_number)
+        assert sequential_frame.index == frame_number
+        assert (sequential_frame.frame == seek_frame.frame).all()
+        assert test_object._last_decoded_index == frame_number - 1
+    container = test_object._container
+    test_object.extract_frame(TARGET_FC)
+    assert test_object._container is container
+    test_object.close()
+    assert test_object._container is None
@@ -1,6 +1,9 @@
 import os.path
 import shutil
 
+import cv2
+import numpy
+
 from sinner.helpers import FrameHelper
 from tests.constants import target_png, tmp_dir
 
@@ -29,6 +32,24 @@ def test_read_from_image() -> None:
     assert 2789640 == image.size
 
 
+def test_read_from_image_channels(monkeypatch) -> None:
+    monkeypatch.setattr(FrameHelper, 'WINDOWS', True)
+    os.makedirs(tmp_dir, exist_ok=True)
+    gray_path = os.path.join(tmp_dir, 'gray.png')
+    bgra_path = os.path.join(tmp_dir, 'bgra.png')
+    cv2.imwrite(gray_path, numpy.full((4, 5), 100, dtype=numpy.uint8))
+    cv2.imwrite(bgra_path, numpy.full((4, 5, 4), (1, 2, 3, 0), dtype=numpy.uint8))
+
+    gray_image = FrameHelper.read_from_image(gray_path)
+    assert (4, 5, 3) == gray_image.shape
+    assert (gray_image == 100).all()
+
+    bgra_image = FrameHelper.read_from_image(bgra_path)
+    assert (4, 5, 3) == bgra_image.shape
+    assert bgra_image.flags['C_CONTIGUOUS']
+    assert (bgra_image == (1, 2, 3)).all()
+
+
 def test_scale() -> None:
     test_frame = FrameHelper.create((10, 15))
     resized_frame = FrameHelper.scale(test_frame, 10)
@@ -86,6 +107,14 @@ def test_resize_proportional() -> None:
     assert resized_frame.shape == (1, 1, 3)
 
 
+def test_proportional_shape() -> None:
+    assert FrameHelper.proportional_shape((10, 15, 3), (20, 30)) == (20, 30)
+    assert FrameHelper.proportional_shape((10, 15, 3), (30, 30)) == (20, 30)
+    assert FrameHelper.proportional_shape((10, 15), (3, 3)) == (2, 3)
+    assert FrameHelper.proportional_shape((10, 15), (10, 20)) == (10, 15)
+    assert FrameHelper.proportional_shape((10, 15), (1, 1)) == (1, 1)
+
+
 def test_resize_proportional_image() -> None:
     test_image = FrameHelper.read_from_image(target_png)
     assert (1080, 861, 3) == test_image.shape
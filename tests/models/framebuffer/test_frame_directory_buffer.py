@@ -91,6 +91,13 @@ class TestFrameDirectoryBufferLoad:
         assert buffer.zfill_length == len(str(TARGET_FC))
         assert os.path.exists(buffer.path)  # Проверяем, что директория создана
 
+    def test_get_frame_path(self, loaded_frame_buffer):
+        """Проверка построения пути кадра по предварительно подготовленному формату имени."""
+        for index in (0, 7, TARGET_FC):
+            filename = str(index).zfill(loaded_frame_buffer.zfill_length) + loaded_frame_buffer._writer.extension
+            assert loaded_frame_buffer.get_frame_path(index) == os.path.join(loaded_frame_buffer.path, filename)
+            assert loaded_frame_buffer.get_frame_processed_name(NumberedFrame(index, None)) == loaded_frame_buffer.get_frame_path(index)
+
     def test_flush(self, loaded_frame_buffer):
         """Проверка очистки буфера."""
         loaded_frame_buffer.flush()
@@ -210,6 +217,28 @@ class TestFrameDirectoryBufferThreadSafety:
         filepath = os.path.join(loaded_frame_buffer.path, filename)
         assert os.path.exists(filepath)
 
+    def test_add_frame_does_not_block_readers(self, loaded_frame_buffer, sample_frame):
+        """Проверка, что запись кадра на диск не удерживает блокировку индексов."""
+        writing = threading.Event()
+        release = threading.Event()
+        original_write = loaded_frame_buffer._writer.write
+
+        def slow_write(image, path):
+            writing.set()
+            release.wait(5)
+            return original_write(image, path)
+
+        with patch.object(loaded_frame_buffer._writer, 'write', side_effect=slow_write):
+            thread = threading.Thread(target=loaded_frame_buffer.add_frame, args=(sample_frame,))
+            thread.start()
+            assert writing.wait(5)
+            assert loaded_frame_buffer._indices_lock.acquire(timeout=1)  # блокировка свободна во время записи
+            loaded_frame_buffer._indices_lock.release()
+            assert loaded_frame_buffer.has_index(sample_frame.index) is False
+            release.set()
+            thread.join()
+        assert loaded_frame_buffer.has_index(sample_frame.index) is True
+
 
 class TestImprovements:
     """Тесты для проверки предлагаемых улучшений."""
@@ -224,6 +253,32 @@ class TestImprovements:
         assert loaded_frame_buffer.has_index(5) is True
         assert loaded_frame_buffer.has_index(7) is False
 
+    def test_has_index_after_add_and_flush(self, loaded_frame_buffer):
+        """Проверка согласованности множества индексов при добавлении и очистке."""
+        loaded_frame_buffer.add_index(3)
+        assert loaded_frame_buffer.has_index(3) is True
+        assert loaded_frame_buffer.get_indices() == [3]
+        loaded_frame_buffer.flush()
+        assert loaded_frame_buffer.has_index(3) is False
+
+    def test_has_indices(self, loaded_frame_buffer):
+        """Проверка пакетной проверки индексов и упорядоченного списка индексов."""
+        loaded_frame_buffer._indices = [10, 1, 5]
+        loaded_frame_buffer.add_index(3)
+        loaded_frame_buffer.add_index(3)
+        assert loaded_frame_buffer.has_indices([1, 2, 3, 10, 11]) == [True, False, True, True, False]
+        assert loaded_frame_buffer.get_indices() == [1, 3, 5, 10]
+
+    def test_get_previous_index(self, loaded_frame_buffer):
+        """Проверка поиска ближайшего предыдущего индекса в разреженном буфере."""
+        loaded_frame_buffer._indices = [10, 1, 5000]
+        loaded_frame_buffer.add_index(7)
+        assert loaded_frame_buffer.get_previous_index(1) is None
+        assert loaded_frame_buffer.get_previous_index(8) == 7
+        assert loaded_frame_buffer.get_previous_index(10) == 7
+        assert loaded_frame_buffer.get_previous_index(4000) == 10
+        assert loaded_frame_buffer.get_previous_index(99999) == 5000
+
     def test_get_indices_returns_copy(self, loaded_frame_buffer):
         """Проверка, что get_indices возвращает копию списка."""
         # Добавляем индексы для тестирования
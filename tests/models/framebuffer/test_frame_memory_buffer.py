@@ -7,6 +7,7 @@ import tempfile
 from concurrent.futures import ThreadPoolExecutor
 
 from sinner.models.NumberedFrame import NumberedFrame
+from sinner.models.framebuffer.FrameDirectoryBuffer import FrameDirectoryBuffer
 from sinner.models.framebuffer.FrameMemoryBuffer import FrameMemoryBuffer
 from tests.constants import tmp_dir
 
@@ -82,7 +83,7 @@ class TestBasicFunctionality:
         # Проверяем наличие методов lock вместо проверки типа
         assert hasattr(buffer._buffer_lock, 'acquire')
         assert hasattr(buffer._buffer_lock, 'release')
-        assert isinstance(buffer._disk_write_executor, ThreadPoolExecutor)
+        assert buffer._disk_write_executor is None  # создаётся при первой асинхронной записи
         assert buffer._memory_buffer == {}
         assert buffer._frame_sizes == {}
         assert not buffer._remove_earlier_frames  # По умолчанию выключено
@@ -121,6 +122,7 @@ class TestAddFrame:
         assert sample_frame.index in memory_buffer._memory_buffer
         assert memory_buffer._current_buffer_size > 0
         assert memory_buffer._frame_sizes[sample_frame.index] == sample_frame.frame.nbytes
+        assert isinstance(memory_buffer._disk_write_executor, ThreadPoolExecutor)
 
         # Даём время на асинхронную запись на диск
         time.sleep(0.1)
@@ -149,6 +151,7 @@ class TestAddFrame:
         # Проверяем, что кадр не попал в память (буфер отключен)
         assert sample_frame.index not in disk_only_buffer._memory_buffer
         assert disk_only_buffer._current_buffer_size == 0
+        assert disk_only_buffer._disk_write_executor is None  # запись синхронная, потоки не создаются
 
         # Даём время на запись на диск
         time.sleep(0.1)
@@ -343,6 +346,20 @@ class TestGetFrame:
         assert 1 in memory_buffer_with_early_removal._memory_buffer
         assert 2 in memory_buffer_with_early_removal._memory_buffer
 
+    def test_early_removal_out_of_order(self, memory_buffer, multiple_frames):
+        """Проверка удаления ранних кадров, добавленных не по порядку, и повторного добавления кадра."""
+        for frame in reversed(multiple_frames):
+            memory_buffer.add_frame(frame)
+        memory_buffer.add_frame(multiple_frames[0])  # повторное добавление не должно учитывать размер дважды
+        assert memory_buffer._memory_indices == [1, 2, 3, 4, 5]
+        assert memory_buffer._current_buffer_size == sum(frame.frame.nbytes for frame in multiple_frames)
+
+        assert memory_buffer.get_frame(4, remove_earlier_frames=True).index == 4
+
+        assert memory_buffer._memory_indices == [5]
+        assert list(memory_buffer._memory_buffer.keys()) == [5]
+        assert memory_buffer._current_buffer_size == multiple_frames[4].frame.nbytes
+
 
 # Тесты мониторинга состояния буфера
 class TestBufferState:
@@ -368,6 +385,16 @@ class TestBufferState:
 
         assert memory_buffer.has_index(sample_frame.index)
 
+    def test_has_indices(self, memory_buffer, multiple_frames):
+        """Проверка has_indices для кадров в памяти, ещё не записанных на диск."""
+        memory_buffer._disk_write_executor = ThreadPoolExecutor(max_workers=1)
+        memory_buffer._disk_write_executor.submit(time.sleep, 0.2)  # запись на диск откладывается
+        memory_buffer.add_frame(multiple_frames[0])
+
+        assert not FrameDirectoryBuffer.has_index(memory_buffer, multiple_frames[0].index)  # на диске кадра ещё нет
+        assert memory_buffer.has_indices([multiple_frames[0].index, 100]) == [True, False]
+        memory_buffer._disk_write_executor.shutdown(wait=True)
+
     def test_has_index_disk_only(self, disk_only_buffer, sample_frame):
         """Проверка has_index для кадра при отключенном буфере памяти."""
         disk_only_buffer.add_frame(sample_frame)
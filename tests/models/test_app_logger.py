@@ -1,14 +1,16 @@
+import io
 import logging
 import os
 import platform
 import tempfile
-from logging.handlers import SysLogHandler, TimedRotatingFileHandler, RotatingFileHandler
+from logging.handlers import SysLogHandler, TimedRotatingFileHandler, RotatingFileHandler, QueueHandler, MemoryHandler
 from unittest.mock import patch, Mock
 import pytest
 
 from colorama import Fore, Back, Style
 
-from sinner.AppLogger import app_logger, LevelBasedFormatter, ColoredFormatter, add_handler, remove_handler, setup_logging
+from sinner import AppLogger
+from sinner.AppLogger import app_logger, LevelBasedFormatter, ColoredFormatter, BufferedStreamHandler, add_handler, remove_handler, setup_logging, stop_logging
 
 
 # Фикстуры для тестов
@@ -26,6 +28,7 @@ def clean_logger():
     yield  # Выполняем тест
 
     # Восстанавливаем логгер после теста
+    stop_logging()
     for handler in app_logger.handlers[:]:
         app_logger.removeHandler(handler)
 
@@ -44,6 +47,7 @@ def temp_log_file():
     yield path
 
     # Очищаем все обработчики перед попыткой удаления файла
+    stop_logging()
     for handler in app_logger.handlers[:]:
         app_logger.removeHandler(handler)
         if hasattr(handler, 'close'):
@@ -144,35 +148,77 @@ class TestHandlers:
         handler = add_handler('stdout')
 
         assert handler in app_logger.handlers
-        assert isinstance(handler, logging.StreamHandler)
+        assert isinstance(handler, BufferedStreamHandler)
         assert isinstance(handler.formatter, ColoredFormatter)
 
+    def test_buffered_stream_handler(self):
+        """Тест накопления записей в потоковом обработчике"""
+        stream = io.StringIO()
+        handler = BufferedStreamHandler(stream, flush_interval=60)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        for message in ["First message", "Second message"]:
+            handler.handle(logging.LogRecord(name="test", level=logging.INFO, pathname="", lineno=0, msg=message, args=(), exc_info=None))
+
+        assert stream.getvalue() == ''
+
+        handler.flush()
+        assert stream.getvalue() == 'First message\nSecond message\n'
+        handler.close()
+
     def test_add_file_handler(self, clean_logger, temp_log_file):
         """Тест добавления файлового обработчика"""
         handler = add_handler('file', filename=temp_log_file)
 
+        assert handler in app_logger.handlers
+        assert isinstance(handler, MemoryHandler)
+        assert isinstance(handler.target, logging.FileHandler)
+        assert isinstance(handler.target.formatter, LevelBasedFormatter)
+        assert handler.target.baseFilename == temp_log_file
+
+    def test_add_unbuffered_file_handler(self, clean_logger, temp_log_file):
+        """Тест добавления файлового обработчика без буферизации"""
+        handler = add_handler('file', filename=temp_log_file, capacity=0)
+
         assert handler in app_logger.handlers
         assert isinstance(handler, logging.FileHandler)
         assert isinstance(handler.formatter, LevelBasedFormatter)
         assert handler.baseFilename == temp_log_file
 
+    def test_buffered_file_handler(self, clean_logger, temp_log_file):
+        """Тест сброса буфера файлового обработчика"""
+        handler = add_handler('file', filename=temp_log_file, capacity=10, flushLevel=logging.ERROR)
+        app_logger.setLevel(logging.DEBUG)
+
+        app_logger.info("Buffered message")
+        with open(temp_log_file) as f:
+            assert "Buffered message" not in f.read()
+
+        app_logger.error("Error message")
+        with open(temp_log_file) as f:
+            log_content = f.read()
+        assert "Buffered message" in log_content
+        assert "Error message" in log_content
+
+        remove_handler(handler)
+        handler.close()
+
     def test_add_rotating_file_handler(self, clean_logger, temp_log_file):
         """Тест добавления обработчика с ротацией по размеру"""
         handler = add_handler('rotating_file', filename=temp_log_file, maxBytes=1024, backupCount=3)
 
         assert handler in app_logger.handlers
-        assert isinstance(handler, RotatingFileHandler)
-        assert handler.maxBytes == 1024
-        assert handler.backupCount == 3
+        assert isinstance(handler.target, RotatingFileHandler)
+        assert handler.target.maxBytes == 1024
+        assert handler.target.backupCount == 3
 
     def test_add_timed_rotating_file_handler(self, clean_logger, temp_log_file):
         """Тест добавления обработчика с ротацией по времени"""
         handler = add_handler('timed_rotating_file', filename=temp_log_file, when='H', backupCount=5)
 
         assert handler in app_logger.handlers
-        assert isinstance(handler, TimedRotatingFileHandler)
-        assert handler.when == 'H'
-        assert handler.backupCount == 5
+        assert isinstance(handler.target, TimedRotatingFileHandler)
+        assert handler.target.when == 'H'
+        assert handler.target.backupCount == 5
 
     def test_handler_level(self, clean_logger):
         """Тест установки уровня логирования для обработчика"""
@@ -198,7 +244,9 @@ class TestHandlers:
         setup_logging(handlers=None)
 
         assert len(app_logger.handlers) == 1
-        assert isinstance(app_logger.handlers[0], logging.StreamHandler)
+        assert isinstance(app_logger.handlers[0], QueueHandler)
+        assert len(AppLogger.app_listener.handlers) == 1
+        assert isinstance(AppLogger.app_listener.handlers[0], logging.StreamHandler)
 
     def test_setup_with_invalid_handler_spec(self, clean_logger):
         """Тест обработки неверного формата спецификации обработчика"""
@@ -214,7 +262,8 @@ class TestSetupLogging:
         setup_logging()
 
         assert len(app_logger.handlers) == 1
-        assert isinstance(app_logger.handlers[0], logging.StreamHandler)
+        assert isinstance(app_logger.handlers[0], QueueHandler)
+        assert isinstance(AppLogger.app_listener.handlers[0], logging.StreamHandler)
         assert app_logger.level == logging.DEBUG
 
     def test_setup_custom_level(self, clean_logger):
@@ -227,9 +276,10 @@ class TestSetupLogging:
         """Тест настройки с несколькими обработчиками"""
         setup_logging(handlers=['stdout', {'type': 'file', 'filename': temp_log_file}])
 
-        assert len(app_logger.handlers) == 2
-        handler_types = [type(h) for h in app_logger.handlers]
-        assert logging.StreamHandler in handler_types
+        assert len(app_logger.handlers) == 1
+        assert len(AppLogger.app_listener.handlers) == 2
+        handler_types = [type(getattr(h, 'target', h)) for h in AppLogger.app_listener.handlers]
+        assert BufferedStreamHandler in handler_types
         assert logging.FileHandler in handler_types
 
     def test_setup_clears_previous_handlers(self, clean_logger):
@@ -244,6 +294,24 @@ class TestSetupLogging:
         # Должен быть только один обработчик, а не два
         assert len(app_logger.handlers) == 1
 
+    def test_setup_restarts_listener(self, clean_logger):
+        """Тест замены слушателя очереди при повторной настройке"""
+        setup_logging()
+        first_listener = AppLogger.app_listener
+        setup_logging()
+
+        assert AppLogger.app_listener is not first_listener
+        assert first_listener._thread is None
+
+    def test_stop_logging(self, clean_logger):
+        """Тест остановки слушателя очереди"""
+        setup_logging()
+        listener = AppLogger.app_listener
+        stop_logging()
+
+        assert AppLogger.app_listener is None
+        assert listener._thread is None
+
 
 # Тесты функциональности логирования
 class TestLoggingFunctionality:
@@ -253,6 +321,7 @@ class TestLoggingFunctionality:
 
         test_message = "Test log message"
         app_logger.info(test_message)
+        stop_logging()  # дожидаемся записи из потока слушателя
 
         # Проверяем, что сообщение записалось в файл
         with open(temp_log_file) as f:
@@ -314,6 +383,7 @@ class TestLoggingFunctionality:
         # Запись данных, превышающих лимит
         for i in range(20):
             app_logger.info(f"Сообщение номер {i} с достаточно длинным текстом для превышения лимита")
+        stop_logging()
 
         # Проверка, что созданы ротированные файлы
         assert os.path.exists(temp_log_file)
@@ -1,7 +1,7 @@
 import statistics
 
-from sinner.utilities import get_all_base_names, format_sequences, get_directory_file_list, is_image
-from tests.constants import state_frames_dir
+from sinner.utilities import get_all_base_names, format_sequences, get_directory_file_list, is_image, is_video, get_type_extensions, has_image_mimetype, has_video_mimetype
+from tests.constants import state_frames_dir, target_mp4, target_png
 
 
 def test_get_all_base_names() -> None:
@@ -51,3 +51,20 @@ def test_get_directory_file_list() -> None:
     assert len(file_list) == 11
     file_list = get_directory_file_list(state_frames_dir, is_image)
     assert len(file_list) == 10
+
+
+def test_file_type_predicates() -> None:
+    assert is_image(target_png) is True
+    assert is_video(target_png) is False
+    assert is_video(target_mp4) is True
+    assert is_image(target_mp4) is False
+    assert has_image_mimetype('missing.png') is True
+    assert has_video_mimetype('missing.png') is False
+    assert is_image('missing.png') is False
+
+
+def test_get_type_extensions() -> None:
+    image_extensions = get_type_extensions('image/')
+    assert '.png' in image_extensions
+    image_extensions.clear()  # the cached value should not be affected
+    assert '.png' in get_type_extensions('image/')
@@ -14,6 +14,17 @@ def test_init() -> None:
     assert params.key10 is True
 
 
+def test_init_value_with_separator() -> None:
+    params = Parameters.command_line_to_namespace('--key1=value=1 --key-two value2')
+    assert params.key1 == 'value=1'
+    assert params.key_two == 'value2'
+
+
+def test_split_command_line() -> None:
+    assert Parameters.split_command_line('--key1=value1  --key2 value2') == ('--key1=value1', '--key2', 'value2')
+    assert Parameters.split_command_line('--key1="quoted value" --key2 \'value 2\'') == ('--key1=quoted value', '--key2', 'value 2')
+
+
 def test_parameters_aliases_loading() -> None:
     test_object = TestParameterAliases()
     assert hasattr(test_object, 'param_one') is False